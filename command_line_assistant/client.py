@@ -17,6 +17,7 @@ from command_line_assistant.commands.cli import (
 from command_line_assistant.commands.feedback import feedback_command
 from command_line_assistant.commands.history import history_command
 from command_line_assistant.commands.shell import shell_command
+from command_line_assistant.constants import VERSION
 from command_line_assistant.logger import setup_client_logging
 from command_line_assistant.rendering.renderers import Renderer
 from command_line_assistant.rendering.theme import Theme
@@ -41,6 +42,9 @@ def register_subcommands() -> ArgumentParser:
 
 logger = logging.getLogger(__name__)
 
+#: Invocations that only ask for the program version
+VERSION_ARGV: tuple[list[str], ...] = (["--version"], ["-v"])
+
 
 def main() -> int:
     """Main function for the cli entrypoint
@@ -48,6 +52,11 @@ def main() -> int:
     Returns:
         int: Status code of the execution
     """
+    # Answer a bare version request before building the whole parser tree.
+    if sys.argv[1:] in VERSION_ARGV:
+        print(VERSION)
+        return os.EX_OK
+
     parser = register_subcommands()
 
     # Create the error and warning renderers, checking very early if the user
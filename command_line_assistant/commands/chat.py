@@ -73,6 +73,10 @@ ALWAYS_LEGAL_MESSAGE = "Always review AI-generated content prior to use."
 DEFAULT_CHAT_DESCRIPTION = "Default Command Line Assistant Chat."
 #: Default chat name when none is given
 DEFAULT_CHAT_NAME = "default"
+#: Prompt shown before each question in interactive mode
+INTERACTIVE_PROMPT = ">>> "
+#: Separator drawn around each response
+RESPONSE_SEPARATOR = "─" * 72
 
 
 @dataclass
@@ -365,15 +369,20 @@ def _display_response(renderer: Renderer, response: str) -> None:
         response (str): The response to display.
     """
 
-    if _handle_legal_message():
-        renderer.notice(LEGAL_NOTICE)
+    show_legal_notice = _handle_legal_message()
 
-    renderer.notice("─" * 72)
-    renderer.normal("")
-    renderer.markdown(response)
-    renderer.normal("")
-    renderer.notice("─" * 72)
-    renderer.notice(ALWAYS_LEGAL_MESSAGE)
+    # The response arrives in full, so print it as one block rather than
+    # flushing the terminal line by line.
+    with renderer.batch():
+        if show_legal_notice:
+            renderer.notice(LEGAL_NOTICE)
+
+        renderer.notice(RESPONSE_SEPARATOR)
+        renderer.normal("")
+        renderer.markdown(response)
+        renderer.normal("")
+        renderer.notice(RESPONSE_SEPARATOR)
+        renderer.notice(ALWAYS_LEGAL_MESSAGE)
 
 
 @timing.timeit
@@ -629,7 +638,7 @@ def _interactive_chat(
     try:
         while True:
             try:
-                question = input(">>> ").strip()
+                question = input(INTERACTIVE_PROMPT).strip()
             except EOFError:
                 # Handle Ctrl+D
                 break
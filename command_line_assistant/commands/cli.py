@@ -20,9 +20,10 @@ Example:
 
 import argparse
 import dataclasses
-import getpass
+import functools
 import logging
 import os
+import re
 import select
 import sys
 from argparse import SUPPRESS, ArgumentParser, Namespace, _SubParsersAction
@@ -31,24 +32,42 @@ from pathlib import Path
 from typing import Any, Optional
 
 from command_line_assistant.constants import VERSION
+from command_line_assistant.utils.files import normalize_newlines
 
 logger = logging.getLogger(__name__)
 
 # Define the type here so pyright is happy with it.
 SubParsersAction = _SubParsersAction
 
-GLOBAL_FLAGS: list[str] = [
-    "-p",
-    "--plain",
-    "--debug",
-    "--version",
-    "-v",
-    "-h",
-    "--help",
-]
-ARGS_WITH_VALUES: list[str] = ["--clear"]
+GLOBAL_FLAGS: frozenset[str] = frozenset(
+    {
+        "-p",
+        "--plain",
+        "--debug",
+        "--version",
+        "-v",
+        "-h",
+        "--help",
+    }
+)
+SUBCOMMANDS: frozenset[str] = frozenset({"chat", "history", "shell", "feedback"})
+
+#: Token classes used to classify each argv entry with a single lookup
+_GLOBAL_FLAG = 1
+_SUBCOMMAND = 2
+_TOKEN_CLASS: dict[str, int] = {
+    **dict.fromkeys(GLOBAL_FLAGS, _GLOBAL_FLAG),
+    **dict.fromkeys(SUBCOMMANDS, _SUBCOMMAND),
+}
 
 OS_RELEASE_PATH = Path("/etc/os-release")
+#: Location used by systems that do not ship /etc/os-release (see os-release(5))
+OS_RELEASE_FALLBACK_PATH = Path("/usr/lib/os-release")
+#: Matches a ``KEY=value`` assignment, capturing the raw value up to the end
+#: of the line
+_OS_RELEASE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)=([^\n]*)", re.MULTILINE)
+#: Matches the backslash escapes allowed inside quoted os-release values
+_OS_RELEASE_ESCAPE_RE = re.compile(r"""\\(["'\\$`])""")
 
 # Define a `CommandFunc` type alias to assist in the type definitions for the
 # sub-commands decorators. The `CommandFunc` type definition accepts two
@@ -71,7 +90,63 @@ ArgumentSpec = tuple[tuple[str, ...], dict[str, Any]]
 # Internal dictionary to hold sub-commands registered to the application.
 _commands: dict[str, "Command"] = {}
 
-logger = logging.getLogger(__name__)
+
+def _default_username() -> str:
+    """Return the name of the current user.
+
+    Note:
+        `getpass` is only imported when a `CommandContext` is created, instead
+        of when this module is.
+
+    Returns:
+        str: The username of the current user.
+    """
+    import getpass
+
+    return getpass.getuser()
+
+
+def _unquote_os_release_value(value: str) -> str:
+    """Strip the surrounding quotes and escapes from an os-release value.
+
+    Arguments:
+        value (str): The raw value, as found after the "=" sign
+
+    Returns:
+        str: The unquoted value
+    """
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        value = value[1:-1]
+
+    if "\\" in value:
+        value = _OS_RELEASE_ESCAPE_RE.sub(r"\1", value)
+
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _load_os_release() -> dict[str, str]:
+    """Read and parse the OS Release file once per process.
+
+    Raises:
+        ValueError: If the OS Release file is not found.
+
+    Returns:
+        dict[str, str]: The OS release information with lowercased keys.
+    """
+    try:
+        contents = OS_RELEASE_PATH.read_text()
+    except FileNotFoundError:
+        try:
+            contents = OS_RELEASE_FALLBACK_PATH.read_text()
+        except FileNotFoundError as e:
+            raise ValueError("OS Release file not found.") from e
+
+    return {
+        key.lower(): _unquote_os_release_value(value)
+        for key, value in _OS_RELEASE_RE.findall(contents)
+    }
 
 
 @dataclasses.dataclass
@@ -87,30 +162,12 @@ class CommandContext:
         os_release (dict[str, str]): A dictionary with the OS release information.
     """
 
-    username: str = getpass.getuser()
-    effective_user_id: int = os.geteuid()
-
-    # Empty dictionary for os_release information. Parsed at the __post__init__
-    # method.
-    os_release: dict[str, str] = dataclasses.field(default_factory=dict)
-
-    def __post_init__(self):
-        """Post init method to parse the OS Release file.
+    username: str = dataclasses.field(default_factory=_default_username)
+    effective_user_id: int = dataclasses.field(default_factory=os.geteuid)
 
-        Raises:
-            ValueError: If the OS Release file is not found.
-        """
-        try:
-            contents = OS_RELEASE_PATH.read_text()
-            # Clean the empty lines
-            contents = [content for content in contents.splitlines() if content]
-            for line in contents:
-                splitted_line = line.strip().split("=", 1)
-                key = splitted_line[0].lower()
-                value = splitted_line[1].strip('"')
-                self.os_release[key] = value
-        except FileNotFoundError as e:
-            raise ValueError("OS Release file not found.") from e
+    os_release: dict[str, str] = dataclasses.field(
+        default_factory=lambda: dict(_load_os_release())
+    )
 
 
 def add_default_command(stdin: Optional[str], argv: list[str]) -> list[str]:
@@ -132,41 +189,18 @@ def add_default_command(stdin: Optional[str], argv: list[str]) -> list[str]:
     global_flags = []
     command_args = []
     for arg in argv_list:
-        if arg in GLOBAL_FLAGS:
+        token_class = _TOKEN_CLASS.get(arg)
+        # An exact match for any of the commands means the user picked one
+        # explicitly, so there is nothing to add.
+        if token_class == _SUBCOMMAND:
+            return argv_list
+
+        if token_class == _GLOBAL_FLAG:
             global_flags.append(arg)
         else:
             command_args.append(arg)
 
-    subcommand = _subcommand_used(argv)
-    if not subcommand:
-        return global_flags + ["chat"] + command_args
-
-    return argv_list
-
-
-def _subcommand_used(args: list[str]) -> Optional[str]:
-    """Return what subcommand has been used by the user. Return None if no subcommand has been used.
-
-    Arguments:
-        args (list[str]): The arguments from the command line
-
-    Returns:
-        Optional[str]: If we find a match for the argument, we return it, otherwise we return None.
-    """
-    for index, argument in enumerate(args):
-        # It means that we hit a --version/--help
-        if argument in GLOBAL_FLAGS:
-            continue
-
-        # If we have a exact match for any of the commands, return directly
-        if argument in ("chat", "history", "shell", "feedback"):
-            return argument
-
-        # Otherwise, check if this is the second part of an arg that takes a value.
-        elif index > 0 and args[index - 1] in ARGS_WITH_VALUES:
-            continue
-
-    return None
+    return global_flags + ["chat"] + command_args
 
 
 def create_argument_parser() -> tuple[ArgumentParser, SubParsersAction]:
@@ -214,6 +248,24 @@ def create_argument_parser() -> tuple[ArgumentParser, SubParsersAction]:
     return parser, commands_parser
 
 
+def _stdin_has_input() -> bool:
+    """Check, without blocking, whether stdin has data ready to be read.
+
+    Note:
+        `poll()` is used when available since it only deals with the single
+        file descriptor we care about, falling back to `select()` otherwise.
+
+    Returns:
+        bool: True if reading from stdin will not block.
+    """
+    if not hasattr(select, "poll"):
+        return bool(select.select([sys.stdin], [], [], 0.0)[0])
+
+    poller = select.poll()
+    poller.register(sys.stdin, select.POLLIN)
+    return bool(poller.poll(0))
+
+
 def read_stdin() -> str:
     """Parse the std input when a user give us.
 
@@ -227,11 +279,26 @@ def read_stdin() -> str:
         str: Return the stdin that was read or if there is nothing, return an
         empty string.
     """
+    # An interactive terminal never carries piped input, so skip the poll
+    # syscall entirely in that case.
+    if sys.stdin.isatty():
+        return ""
+
     # Check if there's input available on stdin
-    if select.select([sys.stdin], [], [], 0.0)[0]:
-        # If there is input, read it
+    if _stdin_has_input():
+        # If there is input, read it. Reading the raw bytes in one go skips
+        # the text layer's incremental decoding; the newline translation it
+        # would have done is applied to the decoded text instead.
+        stdin_buffer = getattr(sys.stdin, "buffer", None)
         try:
-            input_data = sys.stdin.read().strip()
+            if stdin_buffer is None:
+                input_data = sys.stdin.read().strip()
+            else:
+                input_data = normalize_newlines(
+                    stdin_buffer.read().decode(
+                        sys.stdin.encoding or "utf-8", sys.stdin.errors or "strict"
+                    )
+                ).strip()
         except UnicodeDecodeError as e:
             raise ValueError("Binary input are not supported.") from e
 
@@ -13,15 +13,6 @@ from command_line_assistant.config.schemas.history import HistorySchema
 from command_line_assistant.config.schemas.logging import LoggingSchema
 from command_line_assistant.utils.environment import get_xdg_config_path
 
-# tomllib is available in the stdlib after Python3.11. Before that, we import
-# from tomli.
-# We are using if/else due to https://github.com/hukkin/tomli/issues/219
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
-
 #: Define the config file path.
 CONFIG_FILE_DEFINITION: tuple[str, str] = (
     "command-line-assistant",
@@ -63,6 +54,16 @@ def load_config_file() -> Config:
     Returns:
         Config: An instance of the configuration file
     """
+    # tomllib is available in the stdlib after Python3.11. Before that, we import
+    # from tomli.
+    # We are using if/else due to https://github.com/hukkin/tomli/issues/219
+    # The import lives here as the parser is only needed when loading the file,
+    # while `Config` itself is imported by many modules.
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
     config_dict = {}
     config_file_path = Path(get_xdg_config_path(), *CONFIG_FILE_DEFINITION)
 
@@ -7,7 +7,7 @@ from json.decoder import JSONDecodeError
 from requests import RequestException, Response
 
 from command_line_assistant.config import Config
-from command_line_assistant.daemon.http.session import get_session
+from command_line_assistant.daemon.http.session import get_shared_session
 from command_line_assistant.dbus.exceptions import RequestFailedError
 
 logger = logging.getLogger(__name__)
@@ -104,12 +104,11 @@ def _send_request(endpoint: str, payload: dict, config: Config) -> Response:
     Returns:
         Response object
     """
-    with get_session(config) as session:
-        return session.post(
-            endpoint,
-            json=payload,  # Uses json parameter instead of manually serializing
-            timeout=config.backend.timeout,
-        )
+    return get_shared_session(config).post(
+        endpoint,
+        json=payload,  # Uses json parameter instead of manually serializing
+        timeout=config.backend.timeout,
+    )
 
 
 def _handle_error_response(response: Response) -> None:
@@ -131,7 +130,7 @@ def _handle_error_response(response: Response) -> None:
         response_json = response.json()
         if "errors" in response_json and isinstance(response_json["errors"], list):
             # 3scale returns errors wrapped in a JSON object with a list of errors
-            for error in response.json()["errors"]:
+            for error in response_json["errors"]:
                 if error["status"] == response.status_code and "detail" in error:
                     detailed_message = error["detail"]
                     break
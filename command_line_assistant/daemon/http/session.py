@@ -1,6 +1,7 @@
 """Handle the http sessions that the daemon issues to the backend."""
 
 import logging
+import threading
 
 from requests.sessions import Session
 
@@ -13,6 +14,9 @@ USER_AGENT = f"clad/{VERSION}"
 
 logger = logging.getLogger(__name__)
 
+#: Per-thread `(config, session)` pair reused by `py:get_shared_session`
+_shared_sessions = threading.local()
+
 
 def get_session(config: Config) -> Session:
     """Retrieve a Session object with SSL capabilities.
@@ -45,3 +49,29 @@ def get_session(config: Config) -> Session:
     session.cert = (config.backend.auth.cert_file, config.backend.auth.key_file)  # type: ignore
 
     return session
+
+
+def get_shared_session(config: Config) -> Session:
+    """Retrieve a Session that is kept alive across queries.
+
+    Reusing the same session keeps its connection pool, so consecutive
+    queries skip the TCP and TLS handshakes with the backend. A session is
+    kept per thread, as sessions are not guaranteed to be thread-safe, and it
+    is rebuilt whenever a different config instance is given.
+
+    Arguments:
+        config (Config): Instance of the config class
+
+    Returns:
+        Session: A mounted session with the necessary adapters.
+    """
+    cached = getattr(_shared_sessions, "cached", None)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    if cached is not None:
+        cached[1].close()
+
+    session = get_session(config)
+    _shared_sessions.cached = (config, session)
+    return session
@@ -1,8 +1,44 @@
-import itertools
+import codecs
+import functools
+import locale
+import os
 import sys
 import threading
-import time
-from typing import Optional
+from typing import Callable, Optional, Union
+
+#: Frames displayed by the spinner animation, in order.
+SPINNER_FRAMES: tuple[str, ...] = (
+    "⁺₊+",
+    "⁻₊+",
+    "⁺₊+",
+    "⁺₊+",
+    "⁺₋+",
+    "⁺₊+",
+    "⁺₊+",
+    "⁺₊−",
+    "⁺₊+",
+)
+#: Frames used instead of SPINNER_FRAMES when the locale can't display them.
+ASCII_SPINNER_FRAMES: tuple[str, ...] = ("-", "\\", "|", "/")
+#: Normalized name of the preferred locale encoding. It doesn't change during
+#: the life of the process, so it is only looked up once.
+LOCALE_ENCODING: str = codecs.lookup(locale.getpreferredencoding(False)).name
+
+
+def _frames_for_encoding(encoding: str) -> tuple[str, ...]:
+    """Return the spinner frames that can be displayed with an encoding.
+
+    Args:
+        encoding: Normalized encoding name, as returned by `codecs.lookup`.
+
+    Returns:
+        tuple[str, ...]: The frames to animate.
+    """
+    return SPINNER_FRAMES if encoding == "utf-8" else ASCII_SPINNER_FRAMES
+
+
+#: Frames used by every spinner, resolved once for the current locale.
+DEFAULT_SPINNER_FRAMES: tuple[str, ...] = _frames_for_encoding(LOCALE_ENCODING)
 
 
 class Spinner:
@@ -12,45 +48,113 @@ class Spinner:
 
     def __init__(self, message: str, plain: bool = False):
         self._message = message
-        self._frames = itertools.cycle(
-            [
-                "⁺₊+",
-                "⁻₊+",
-                "⁺₊+",
-                "⁺₊+",
-                "⁺₋+",
-                "⁺₊+",
-                "⁺₊+",
-                "⁺₊−",
-                "⁺₊+",
-            ]
-        )
+        # The message never changes while spinning, so build the text that
+        # follows each frame only once.
+        self._suffix = f" {message}..."
+        self._frames = DEFAULT_SPINNER_FRAMES
+        self._rendered_frames = self._render_frames(self._frames, self._suffix)
+        self._frame_index = 0
         self._spinning = False
         self._stop_event: Optional[threading.Event] = None
-        self._current_line_length = 0
         self._plain = plain
 
+    @staticmethod
+    def _render_frames(frames: tuple[str, ...], suffix: str) -> tuple[str, ...]:
+        """Build the exact text written to the terminal for each frame.
+
+        Returning to the start of the line is enough when a frame fully
+        overwrites the previous one; the line is only blanked first when the
+        frame is shorter than the one it replaces.
+
+        Args:
+            frames: The animation frames, in order.
+            suffix: The text displayed after every frame.
+
+        Returns:
+            tuple[str, ...]: The text to write for each frame.
+        """
+        messages = [frame + suffix for frame in frames]
+        rendered = []
+        for index, message in enumerate(messages):
+            previous_length = len(messages[index - 1])
+            clear_line = "\r"
+            if len(message) < previous_length:
+                clear_line = "\r" + " " * previous_length + "\r"
+            rendered.append(clear_line + message)
+        return tuple(rendered)
+
+    def _next_frame(self) -> str:
+        """Return the current frame and advance to the next one."""
+        frame = self._frames[self._frame_index]
+        self._frame_index = (self._frame_index + 1) % len(self._frames)
+        return frame
+
+    def _frame_writer(
+        self,
+    ) -> tuple[Callable[[Union[str, bytes]], object], tuple[Union[str, bytes], ...]]:
+        """Pick how frames are written and return them in the matching form.
+
+        When stderr is backed by a file descriptor, the frames are encoded
+        once and written with ``os.write``, skipping the text layer (and its
+        flush) on every tick. Otherwise, e.g. when stderr was replaced by an
+        in-memory stream, the text frames go through ``write``/``flush``.
+
+        Returns:
+            tuple: The function writing a single frame, and the frames.
+        """
+        stderr = sys.stderr
+        try:
+            fd = stderr.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = -1
+
+        if fd < 0:
+            write = stderr.write
+            flush = stderr.flush
+
+            def write_text(frame):
+                write(frame)
+                flush()
+
+            return write_text, self._rendered_frames
+
+        # Anything still sitting in the text layer has to go out before the
+        # first frame bypasses it.
+        stderr.flush()
+        encoding = stderr.encoding or "utf-8"
+        errors = stderr.errors or "strict"
+        frames = tuple(
+            frame.encode(encoding, errors) for frame in self._rendered_frames
+        )
+        return functools.partial(os.write, fd), frames
+
     def _animate(self):
         """Animation loop that updates the progress indicator with interrupt
         handling."""
         if self._plain:
-            sys.stderr.write(f"{next(self._frames)} {self._message}...")
+            sys.stderr.write(self._next_frame() + self._suffix)
             sys.stderr.flush()
             return
 
-        while self._stop_event and not self._stop_event.is_set():
-            frame = next(self._frames)
-            # Clear the current line and write the new frame
-            clear_line = "\r" + " " * self._current_line_length + "\r"
-            animated_message = f"{frame} {self._message}..."
-            self._current_line_length = len(animated_message)
+        stop_event = self._stop_event
+        if stop_event is None:
+            return
 
-            # Write directly to stderr for real-time animation
-            sys.stderr.write(clear_line + animated_message)
-            sys.stderr.flush()
-            time.sleep(0.1)
+        write_frame, frames = self._frame_writer()
+        while True:
+            write_frame(frames[self._frame_index])
+            self._frame_index = (self._frame_index + 1) % len(frames)
+            # Waiting on the event instead of sleeping lets __exit__ stop the
+            # animation as soon as it is signaled.
+            if stop_event.wait(0.1):
+                break
 
     def __enter__(self) -> "Spinner":
+        # Redrawing frames only makes sense on a terminal; when stderr is
+        # redirected, skip the animation thread and its output entirely.
+        if not self._plain and not sys.stderr.isatty():
+            return self
+
         if not self._spinning:
             self._stop_event = threading.Event()
             self._animation_thread = threading.Thread(target=self._animate)
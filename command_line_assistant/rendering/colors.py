@@ -39,26 +39,9 @@ class Color(Enum):
         if isinstance(color, Color):
             return color
 
-        _colors = {
-            "normal": cls.NORMAL,
-            "black": cls.BLACK,
-            "red": cls.RED,
-            "green": cls.GREEN,
-            "yellow": cls.YELLOW,
-            "blue": cls.BLUE,
-            "magenta": cls.MAGENTA,
-            "cyan": cls.CYAN,
-            "white": cls.WHITE,
-            "bright_black": cls.BRIGHT_BLACK,
-            "bright_red": cls.BRIGHT_RED,
-            "bright_green": cls.BRIGHT_GREEN,
-            "bright_yellow": cls.BRIGHT_YELLOW,
-            "bright_blue": cls.BRIGHT_BLUE,
-            "bright_magenta": cls.BRIGHT_MAGENTA,
-            "bright_cyan": cls.BRIGHT_CYAN,
-            "bright_white": cls.BRIGHT_WHITE,
-        }
-        return _colors[color.lower()] or cls.NORMAL
+        # Member names are the upper-cased color names, so let the enum do the
+        # lookup instead of building a mapping on every call.
+        return cls[color.upper()]
 
     def __str__(self) -> str:
         return self.value
@@ -77,28 +60,26 @@ class Style(Enum):
         if isinstance(style, Style):
             return style
 
-        _styles = {
-            "normal": cls.NORMAL,
-            "bold": cls.BOLD,
-            "italic": cls.ITALIC,
-            "underline": cls.UNDERLINE,
-            "strikethrough": cls.STRIKETHROUGH,
-        }
-        return _styles[style.lower()] or cls.NORMAL
+        return cls[style.upper()]
 
     def __str__(self) -> str:
         return self.value
 
 
+#: Escape sequence that resets both colors and styles. Kept as a plain string
+#: so the helpers below don't go through the enum machinery on every call.
+RESET: str = Color.NORMAL.value
+
+
 def colorize(text: str, color: Union[Color, str]) -> str:
     """Colorize text with the specified color."""
     if os.getenv("NO_COLOR"):
         return text
 
     if isinstance(color, Color):
-        return f"{color.value}{text}{Color.NORMAL.value}"
+        return f"{color.value}{text}{RESET}"
     else:
-        return f"{Color[color.upper()].value}{text}{Color.NORMAL.value}"
+        return f"{Color[color.upper()].value}{text}{RESET}"
 
 
 def stylize(text: str, style: Union[Style, str]) -> str:
@@ -106,6 +87,6 @@ def stylize(text: str, style: Union[Style, str]) -> str:
     if os.getenv("NO_COLOR"):
         return text
     if isinstance(style, Style):
-        return f"{style.value}{text}{Style.NORMAL.value}"
+        return f"{style.value}{text}{RESET}"
     else:
-        return f"{Style[style.upper()].value}{text}{Style.NORMAL.value}"
+        return f"{Style[style.upper()].value}{text}{RESET}"
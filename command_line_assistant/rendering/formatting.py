@@ -2,6 +2,22 @@ import re
 import shutil
 import textwrap
 
+#: The compiled regex to match ANSI escape sequences.
+ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
+def terminal_width() -> int:
+    """
+    Return the width of the terminal, falling back to 80 columns.
+
+    Returns:
+        int: The number of columns available.
+    """
+    try:
+        return shutil.get_terminal_size().columns
+    except Exception:
+        return 80  # Fallback width
+
 
 def wrap(text: str) -> str:
     """
@@ -14,10 +30,7 @@ def wrap(text: str) -> str:
     Returns:
         str: The wrapped string.
     """
-    try:
-        width = shutil.get_terminal_size().columns
-    except Exception:
-        width = 80  # Fallback width
+    width = terminal_width()
 
     # If text contains ANSI codes, handle it specially
     if "\033[" in text:
@@ -48,16 +61,15 @@ def _wrap_ansi_text(text: str, width: int) -> str:
     This function strips ANSI codes for width calculation but preserves them
     in the output.
     """
-    # ANSI escape sequence pattern
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-
     wrapped_lines = []
     for paragraph in text.splitlines():
         if not paragraph.strip():
             wrapped_lines.append("")
         else:
             # Strip ANSI codes for width calculation
-            clean_text = ansi_escape.sub("", paragraph)
+            clean_text = (
+                ANSI_ESCAPE_RE.sub("", paragraph) if "\x1b" in paragraph else paragraph
+            )
 
             # If the clean text fits in one line, don't wrap
             if len(clean_text) <= width:
@@ -6,8 +6,11 @@ This module provides a set of extensions for python-markdown that render
 markdown elements using ANSI escape codes suitable for terminal display.
 """
 
+import functools
+import os
 import re
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from xml.etree import ElementTree as etree
 
 import markdown
@@ -16,15 +19,51 @@ from markdown.postprocessors import Postprocessor
 from markdown.preprocessors import Preprocessor
 from markdown.treeprocessors import Treeprocessor
 
-from command_line_assistant.rendering.colors import Style, colorize, stylize
-from command_line_assistant.rendering.formatting import wrap
+from command_line_assistant.rendering.colors import (
+    RESET,
+    Color,
+    Style,
+    colorize,
+    stylize,
+)
+from command_line_assistant.rendering.formatting import ANSI_ESCAPE_RE, wrap
 from command_line_assistant.rendering.theme import Theme
 
 # Constants
 MIN_TABLE_COLUMN_WIDTH = 3
 TABLE_CELL_PADDING = 2
 HORIZONTAL_RULE_LENGTH = 60
+#: Line drawn for horizontal rules, built once instead of per rule.
+HORIZONTAL_RULE: str = "─" * HORIZONTAL_RULE_LENGTH
 DEFAULT_LIST_INDEX = 1
+#: Characters used to draw each table border as (left, middle, right, horizontal)
+TABLE_BORDER_CHARS: Dict[str, Tuple[str, str, str, str]] = {
+    "top": ("┌", "┬", "┐", "─"),
+    "separator": ("├", "┼", "┤", "─"),
+    "bottom": ("└", "┴", "┘", "─"),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _code_block_label(
+    lang_text: str, border_color: Color, label_color: Color, no_color: bool
+) -> str:
+    """Build the colored start of a code block header.
+
+    Responses tend to repeat the same few languages, so the label is cached.
+    ``no_color`` is only part of the cache key, as ``colorize`` reads the
+    environment itself.
+
+    Args:
+        lang_text: The language label, already padded with spaces.
+        border_color: The color for the border.
+        label_color: The color for the language label.
+        no_color: Whether ``NO_COLOR`` is set.
+
+    Returns:
+        str: The colored border followed by the colored label.
+    """
+    return colorize("──", border_color) + colorize(lang_text, label_color)
 
 
 class ANSIRenderer:
@@ -60,21 +99,22 @@ class ANSIRenderer:
 
     def code_block(self, text: str, language: str = "") -> str:
         """Format code block."""
-        lines = [
-            colorize(line, self.theme.code_block_line)
-            for line in text.rstrip().split("\n")
-        ]
-        longest_line_length = max(len(line) for line in text.rstrip().split("\n"))
+        # Every line is wrapped with the same escape codes, so resolve them
+        # once per block instead of calling `colorize` for each line.
+        line_start, line_end = self._color_codes(self.theme.code_block_line)
+        raw_lines = text.rstrip().split("\n")
+        lines = [f"{line_start}{line}{line_end}" for line in raw_lines]
+        longest_line_length = max(len(line) for line in raw_lines)
 
         if language:
             lang_text = f" {language} snippet "
             padding = longest_line_length - len(lang_text) + 6
-            # Color the border and language name separately
-            header = (
-                colorize("──", self.theme.code_block_border)
-                + colorize(lang_text, self.theme.header)
-                + colorize("─" * padding, self.theme.code_block_border)
-            )
+            header = _code_block_label(
+                lang_text,
+                self.theme.code_block_border,
+                self.theme.header,
+                bool(os.getenv("NO_COLOR")),
+            ) + colorize("─" * padding, self.theme.code_block_border)
             footer_length = padding + len(lang_text) + 2
         else:
             padding = longest_line_length + 6
@@ -115,9 +155,7 @@ class ANSIRenderer:
 
     def horizontal_rule(self) -> str:
         """Format horizontal rule."""
-        return (
-            f"\n{colorize('─' * HORIZONTAL_RULE_LENGTH, self.theme.horizontal_rule)}\n"
-        )
+        return f"\n{colorize(HORIZONTAL_RULE, self.theme.horizontal_rule)}\n"
 
     def format_table(self, rows: List[List[str]], header_row: bool = True) -> str:
         """Format a complete table with proper column alignment."""
@@ -166,20 +204,8 @@ class ANSIRenderer:
 
     def _create_table_border(self, col_widths: List[int], border_type: str) -> str:
         """Create a table border line (top, separator, or bottom)."""
-        border_chars = {
-            "top": ("┌", "┬", "┐", "─"),
-            "separator": ("├", "┼", "┤", "─"),
-            "bottom": ("└", "┴", "┘", "─"),
-        }
-
-        left, middle, right, horizontal = border_chars[border_type]
-        border = left
-        for i, width in enumerate(col_widths):
-            border += horizontal * width
-            if i < len(col_widths) - 1:
-                border += middle
-        border += right
-        return border
+        left, middle, right, horizontal = TABLE_BORDER_CHARS[border_type]
+        return left + middle.join(horizontal * width for width in col_widths) + right
 
     def _format_table_cells(
         self, row: List[str], col_widths: List[int], row_idx: int, header_row: bool
@@ -203,12 +229,25 @@ class ANSIRenderer:
 
         return formatted_cells
 
+    def _color_codes(self, color: Color) -> Tuple[str, str]:
+        """Return the escape codes used by `colorize` around a text.
+
+        Args:
+            color: The color to resolve.
+
+        Returns:
+            A tuple with the start and end escape codes. Both are empty when
+            colors are disabled through the `NO_COLOR` environment variable.
+        """
+        if os.getenv("NO_COLOR"):
+            return "", ""
+        return Color.from_string(color).value, RESET
+
     def _strip_ansi(self, text: str) -> str:
         """Strip ANSI escape codes from text for width calculation."""
-        import re
-
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        if "\x1b" not in text:
+            return text
+        return ANSI_ESCAPE_RE.sub("", text)
 
 
 class FencedCodePreprocessor(Preprocessor):
@@ -250,6 +289,11 @@ class FencedCodePreprocessor(Preprocessor):
         Returns:
             List of processed lines with code blocks replaced by markers
         """
+        # Most chunks carry no fenced code at all; skip the join, the
+        # multiline regex scan and the split in that case.
+        if not any("```" in line for line in lines):
+            return lines
+
         # Join lines into full text for regex matching
         text = "\n".join(lines)
 
@@ -292,28 +336,18 @@ class FencedCodePreprocessor(Preprocessor):
             Code with base indentation removed
         """
         # Find the indentation of the opening fence
-        first_line = full_match.split("\n")[0]
+        first_line = full_match.partition("\n")[0]
         base_indent = len(first_line) - len(first_line.lstrip())
 
         if base_indent == 0:
             return code
 
-        # Remove base indentation from each line
-        lines = code.split("\n")
-        dedented_lines = []
-        for line in lines:
-            if line.startswith(" " * base_indent):
-                dedented_lines.append(line[base_indent:])
-            elif line.startswith("\t" * base_indent):
-                dedented_lines.append(line[base_indent:])
-            elif line.strip() == "":
-                # Preserve empty lines
-                dedented_lines.append("")
-            else:
-                # Line has less indentation than base, keep as is
-                dedented_lines.append(line.lstrip())
-
-        return "\n".join(dedented_lines)
+        # Remove base indentation from every line in a single regex pass:
+        #   * lines indented with the base indentation (spaces or tabs) lose it;
+        #   * whitespace-only lines are emptied;
+        #   * lines with less indentation than the base lose all of it.
+        dedent_pattern = rf"^(?: {{{base_indent}}}|\t{{{base_indent}}}|[ \t]*$|[ \t]*)"
+        return re.sub(dedent_pattern, "", code, flags=re.MULTILINE)
 
     def _create_code_html(self, code: str, language: str, marker_id: str) -> str:
         """Create a simple marker for the code block.
@@ -333,6 +367,9 @@ class FencedCodePreprocessor(Preprocessor):
 class CodeBlockPostprocessor(Postprocessor):
     """Postprocessor that replaces code block markers with ANSI formatted code."""
 
+    # Pattern to match the markers left by the `FencedCodePreprocessor`
+    MARKER_RE = re.compile(r"<!--(?P<marker_id>CODEBLOCK\d+)-->")
+
     def __init__(self, md: markdown.Markdown, renderer: ANSIRenderer):
         """Initialize the postprocessor.
 
@@ -353,16 +390,19 @@ class CodeBlockPostprocessor(Postprocessor):
         Returns:
             Text with code blocks rendered as ANSI
         """
-        # Replace each marker with formatted code
-        for marker_id, block_data in self.code_blocks.items():
-            marker = f"<!--{marker_id}-->"
-            if marker in text:
-                code = block_data["code"]
-                lang = block_data["lang"]
-                formatted = self.renderer.code_block(code, lang)
-                text = text.replace(marker, formatted)
+        if not self.code_blocks:
+            return text
 
-        return text
+        def replace_marker(match: re.Match) -> str:
+            """Replace a matched marker with its formatted code block."""
+            block_data = self.code_blocks.get(match.group("marker_id"))
+            if block_data is None:
+                return match.group(0)
+            return self.renderer.code_block(block_data["code"], block_data["lang"])
+
+        # Replace all markers in a single pass over the text instead of
+        # scanning (and copying) it once per stored code block.
+        return self.MARKER_RE.sub(replace_marker, text)
 
 
 class ANSITreeProcessor(Treeprocessor):
@@ -409,6 +449,9 @@ class ANSITreeProcessor(Treeprocessor):
             # Other
             "br": self._format_br,
         }
+        # Headers (h1-h6)
+        for level in range(1, 7):
+            self._tag_formatters[f"h{level}"] = self._format_header
 
     def run(self, root: etree.Element) -> None:
         """Process the element tree and convert to ANSI text."""
@@ -416,10 +459,13 @@ class ANSITreeProcessor(Treeprocessor):
         self._set_parent_relationships(root)
 
         text = self._process_element(root)
-        # Replace the root with a single text node
+        # Replace the root with a single placeholder pointing to the ANSI text
+        # in the html stash. This way, the serializer doesn't need to walk and
+        # escape the (already rendered) output, and the raw html postprocessor
+        # puts it back untouched. The root is already the neutral container
+        # (`md.doc_tag`) that gets stripped out of the final output.
         root.clear()
-        root.text = text
-        root.tag = "div"  # Use a neutral container
+        root.text = self.md.htmlStash.store(text)
 
     def _set_parent_relationships(
         self, elem: etree.Element, parent: Optional[etree.Element] = None
@@ -436,13 +482,14 @@ class ANSITreeProcessor(Treeprocessor):
         text = elem.text or ""
         tail = elem.tail or ""
 
-        # Process children first
-        child_text = ""
-        for child in elem:
-            child_text += self._process_element(child)
-
-        # Combine text content
-        content = text + child_text
+        if tag == "table":
+            # Tables render their own cells (see `_format_table`), processing
+            # the children here would be done twice and thrown away.
+            content = text
+        else:
+            # Process children first and combine them with the element text
+            # in a single join, instead of growing a string child by child.
+            content = "".join([text, *(self._process_element(child) for child in elem)])
 
         # Apply formatting based on tag
         formatted = self._format_by_tag(tag, elem, content)
@@ -451,12 +498,8 @@ class ANSITreeProcessor(Treeprocessor):
 
     def _format_by_tag(self, tag: str, elem: etree.Element, content: str) -> str:
         """Format content based on HTML tag."""
-        # Check for headers first (h1-h6)
-        if self._is_header_tag(tag):
-            level = int(tag[1])
-            return self.renderer.header(wrap(content), level)
-
-        # Use dispatch table for known tags
+        # Use dispatch table for known tags (headers included), so every
+        # element costs a single lookup.
         formatter = self._tag_formatters.get(tag)
         if formatter:
             return formatter(elem, content)
@@ -464,6 +507,10 @@ class ANSITreeProcessor(Treeprocessor):
         # Default: return wrapped content
         return wrap(content)
 
+    # Header methods
+    def _format_header(self, elem: etree.Element, content: str) -> str:
+        return self.renderer.header(wrap(content), int(elem.tag[1]))
+
     # Text formatting methods
     def _format_bold(self, elem: etree.Element, content: str) -> str:
         return self.renderer.bold(wrap(content))
@@ -480,7 +527,8 @@ class ANSITreeProcessor(Treeprocessor):
     def _format_code(self, elem: etree.Element, content: str) -> str:
         """Format code - inline or block depending on parent."""
         parent = self.parent_map.get(elem)
-        if parent is not None and parent.tag.lower() == "pre":
+        # python-markdown always emits lowercase tags, no need to normalize.
+        if parent is not None and parent.tag == "pre":
             return content  # Handled by <pre> case
         return self.renderer.code_inline(content)
 
@@ -507,8 +555,7 @@ class ANSITreeProcessor(Treeprocessor):
         if parent is None:
             return self.renderer.list_item(wrap(content), ordered=False)
 
-        parent_tag = parent.tag.lower()
-        if parent_tag == "ol":
+        if parent.tag == "ol":
             # Ordered list - track the index
             if parent not in self.list_counters:
                 self.list_counters[parent] = 0
@@ -544,10 +591,6 @@ class ANSITreeProcessor(Treeprocessor):
     def _format_br(self, elem: etree.Element, content: str) -> str:
         return "\n"
 
-    def _is_header_tag(self, tag: str) -> bool:
-        """Check if tag is a header tag (h1-h6)."""
-        return tag.startswith("h") and len(tag) == 2 and tag[1].isdigit()
-
     def _format_code_block(self, elem: etree.Element, content: str) -> str:
         """Format code block element."""
         code_elem = elem.find("code")
@@ -575,7 +618,7 @@ class ANSITreeProcessor(Treeprocessor):
                 # Clean up cell content - remove extra whitespace and newlines
                 cell_content = cell_content.strip().replace("\n", " ")
                 cells.append(cell_content)
-                if cell_elem.tag.lower() == "th":
+                if cell_elem.tag == "th":
                     row_has_th = True
 
             if cells:  # Only add non-empty rows
@@ -604,18 +647,32 @@ class ANSIExtension(Extension):
 
         # Register our fenced code preprocessor
         # This runs before markdown splits text into blocks
-        fenced_preprocessor = FencedCodePreprocessor(md)
-        md.preprocessors.register(fenced_preprocessor, "fenced_code_block", 25)
+        self._fenced_preprocessor = FencedCodePreprocessor(md)
+        md.preprocessors.register(self._fenced_preprocessor, "fenced_code_block", 25)
 
         # Register the tree processor to convert HTML to ANSI
-        tree_processor = ANSITreeProcessor(md, renderer)
-        md.treeprocessors.register(tree_processor, "ansi", 0)
+        self._tree_processor = ANSITreeProcessor(md, renderer)
+        md.treeprocessors.register(self._tree_processor, "ansi", 0)
 
         # Register the postprocessor to replace code block markers with ANSI
         # This runs after the tree processor
         code_postprocessor = CodeBlockPostprocessor(md, renderer)
         md.postprocessors.register(code_postprocessor, "code_blocks", 15)
 
+        # Get `reset` called by `md.reset()`, so the instance can be reused
+        md.registerExtension(self)
+
+    def reset(self) -> None:
+        """Clear the state kept by the processors between two conversions."""
+        self._fenced_preprocessor.code_blocks.clear()
+        self._fenced_preprocessor.counter = 0
+        self._tree_processor.parent_map.clear()
+        self._tree_processor.list_counters.clear()
+
+
+#: Last `ANSIMarkdown` instance used by `markdown_to_ansi`, with its theme.
+_markdown_cache = threading.local()
+
 
 # Convenience functions
 def markdown_to_ansi(text: str, theme: Optional[Theme] = None, **kwargs) -> str:
@@ -630,8 +687,18 @@ def markdown_to_ansi(text: str, theme: Optional[Theme] = None, **kwargs) -> str:
         ANSI formatted text suitable for terminal display
     """
 
-    md = ANSIMarkdown(theme=theme, **kwargs)
-    return md.convert(text)
+    if kwargs:
+        return ANSIMarkdown(theme=theme, **kwargs).convert(text)
+
+    # Building the processor registers every extension and compiles its
+    # patterns, which costs about as much as converting a short text. Keep the
+    # last one around (per thread, as it is stateful) and reuse it for the
+    # same theme.
+    cached = getattr(_markdown_cache, "entry", None)
+    if cached is None or cached[0] is not theme:
+        cached = (theme, ANSIMarkdown(theme=theme))
+        _markdown_cache.entry = cached
+    return cached[1].reset().convert(text)
 
 
 class ANSIMarkdown(markdown.Markdown):
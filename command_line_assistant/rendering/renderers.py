@@ -1,6 +1,9 @@
 """Utility module that provides standardized functions for rendering"""
 
+import bisect
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 
@@ -8,6 +11,18 @@ from command_line_assistant.rendering.colors import colorize
 from command_line_assistant.rendering.stream import StreamWriter
 from command_line_assistant.rendering.theme import Theme
 
+#: Units used by `py:human_readable_size`, ordered from smallest to largest.
+_SIZE_UNITS: tuple[str, ...] = ("B", "KB", "MB", "GB", "TB", "PB")
+
+#: Lower bound (in bytes) of each unit in `py:_SIZE_UNITS`.
+_SIZE_THRESHOLDS: tuple[int, ...] = tuple(1000**i for i in range(len(_SIZE_UNITS)))
+
+#: Format of the dates received by `py:format_datetime` (`str(datetime.now())`).
+_DATETIME_INPUT_FORMAT: str = "%Y-%m-%d %H:%M:%S.%f"
+
+#: Human readable format returned by `py:format_datetime`.
+_DATETIME_OUTPUT_FORMAT: str = "%A, %B %d, %Y at %I:%M:%S %p"
+
 
 def human_readable_size(size: float) -> str:
     """Converts a byte value to a human-readable format (KB, MB, GB).
@@ -18,14 +33,10 @@ def human_readable_size(size: float) -> str:
     Returns:
         str: Size in a human readable format
     """
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    unit_index = 0
-
-    while size >= 1000 and unit_index < len(units) - 1:
-        size /= 1000
-        unit_index += 1
-
-    return f"{size:.2f} {units[unit_index]}"
+    # Pick the unit bucket directly instead of dividing in a loop. Anything
+    # below 1 byte stays in "B" and anything above PB is clamped to "PB".
+    unit_index = max(bisect.bisect_right(_SIZE_THRESHOLDS, size) - 1, 0)
+    return f"{size / _SIZE_THRESHOLDS[unit_index]:.2f} {_SIZE_UNITS[unit_index]}"
 
 
 def format_datetime(unformatted_date: str) -> str:
@@ -37,9 +48,15 @@ def format_datetime(unformatted_date: str) -> str:
     Returns:
         str: The formatted date in human readable time.
     """
-    # Convert str to datetime object
-    date = datetime.strptime(unformatted_date, "%Y-%m-%d %H:%M:%S.%f")
-    return date.strftime("%A, %B %d, %Y at %I:%M:%S %p")
+    # Convert str to datetime object. `fromisoformat` is implemented in C and
+    # understands the `str(datetime)` output, so only fall back to `strptime`
+    # for the inputs it rejects (e.g. a fraction that is not 3 or 6 digits
+    # long in older Python versions).
+    try:
+        date = datetime.fromisoformat(unformatted_date)
+    except ValueError:
+        date = datetime.strptime(unformatted_date, _DATETIME_INPUT_FORMAT)
+    return date.strftime(_DATETIME_OUTPUT_FORMAT)
 
 
 class Renderer:
@@ -60,6 +77,12 @@ class Renderer:
         self._error_writer: StreamWriter = StreamWriter(sys.stderr, theme=theme)
         self._theme = theme or Theme()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Write every message rendered inside the block to stdout at once."""
+        with self._stream_writer.batch():
+            yield
+
     def normal(self, message: str) -> None:
         """Render a message with a normal color.
 
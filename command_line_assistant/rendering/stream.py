@@ -1,11 +1,43 @@
 """Module to hold the stream classes."""
 
+import contextlib
+import io
+import re
 import sys
+from collections.abc import Iterator
 from typing import Optional, TextIO
 
-from command_line_assistant.rendering.markdown import markdown_to_ansi
+from command_line_assistant.rendering.formatting import terminal_width
 from command_line_assistant.rendering.theme import Theme
 
+#: Size (in characters) above which content that still fails to render is
+#: written as-is instead of being kept around for another attempt.
+MAX_BUFFER_SIZE: int = 64 * 1024
+
+#: Single line of text that markdown renders verbatim: it starts with a letter,
+#: has no surrounding whitespace and contains no markup characters.
+PLAIN_TEXT_RE = re.compile(
+    r"[A-Za-z](?:[A-Za-z0-9 ,.;:'\"?!()/%$@]*[A-Za-z0-9,.;:'\"?!()/%$@])?\Z"
+)
+
+
+def markdown_to_ansi(text: str, theme: Theme) -> str:
+    """Render markdown text as ANSI formatted text.
+
+    The markdown module pulls in python-markdown and compiles its patterns on
+    import, so it is only loaded once something actually needs rendering.
+
+    Args:
+        text: The markdown text to render.
+        theme: The theme used for the rendering.
+
+    Returns:
+        str: The ANSI formatted text.
+    """
+    from command_line_assistant.rendering.markdown import markdown_to_ansi as _render
+
+    return _render(text, theme=theme)
+
 
 class StreamWriter:
     """
@@ -28,12 +60,34 @@ class StreamWriter:
             stream: Output stream to write to. Defaults to sys.stdout.
             flush_on_write: Whether to flush the stream after each successful
             write. Defaults to True.
+            theme: Theme used to render markdown.
         """
         self._stream = stream
+        # Resolved once; not every stream-like object has a close method.
+        self._close = getattr(stream, "close", None)
         self._buffer = ""
         self._flush_on_write = flush_on_write
         self._theme = theme or Theme()
 
+    def _try_render(self, content: str) -> Optional[str]:
+        """
+        Render markdown content as ANSI formatted text.
+
+        Only the rendering itself is guarded, so errors raised while writing
+        to the stream are not mistaken for content that can't be rendered yet.
+
+        Args:
+            content: The markdown content to render.
+
+        Returns:
+            Optional[str]: The formatted content, or None if it couldn't be
+            rendered.
+        """
+        try:
+            return markdown_to_ansi(content, theme=self._theme)
+        except Exception:
+            return None
+
     def write_line(self, line: str) -> None:
         """Write a line of unformatted text to the stream."""
         self._stream.write(line + "\n")
@@ -53,21 +107,31 @@ class StreamWriter:
         if not chunk:
             return
 
+        # Plain text needs no parsing as long as it fits on a single line,
+        # the markdown renderer would output it unchanged.
+        if (
+            not self._buffer
+            and PLAIN_TEXT_RE.match(chunk)
+            and len(chunk) <= terminal_width()
+        ):
+            self.write_line(chunk)
+            return
+
         # Combine buffered content with new chunk
         content_to_render = self._buffer + chunk
 
-        try:
-            # Try to render the combined content as markdown
-            formatted_content = markdown_to_ansi(content_to_render, theme=self._theme)
-
-            # If successful, write to stream and clear buffer
+        formatted_content = self._try_render(content_to_render)
+        if formatted_content is not None:
+            # If successful, write to stream and clear buffer. `write_line`
+            # already flushes when `flush_on_write` is set.
+            self._buffer = ""
             self.write_line(formatted_content)
+        elif len(content_to_render) >= MAX_BUFFER_SIZE:
+            # Every retry renders the whole buffer again, so stop
+            # accumulating once it gets large and write it unformatted.
             self._buffer = ""
-
-            if self._flush_on_write:
-                self._stream.flush()
-
-        except Exception:
+            self.write_line(content_to_render)
+        else:
             # If rendering fails, store the content in buffer for next attempt
             self._buffer = content_to_render
 
@@ -79,13 +143,12 @@ class StreamWriter:
         rendering fails, the content is written as-is to the stream.
         """
         if self._buffer:
-            try:
-                # Try to render buffered content one final time
-                formatted_content = markdown_to_ansi(self._buffer, theme=self._theme)
-                self._stream.write(formatted_content)
-            except Exception:
-                # If rendering still fails, write raw content
-                self._stream.write(self._buffer)
+            # Try to render buffered content one final time, and write the raw
+            # content if it still fails.
+            formatted_content = self._try_render(self._buffer)
+            self._stream.write(
+                self._buffer if formatted_content is None else formatted_content
+            )
 
             # Clear the buffer
             self._buffer = ""
@@ -93,6 +156,26 @@ class StreamWriter:
         # Flush the underlying stream
         self._stream.flush()
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Collect everything written inside the block and emit it at once.
+
+        The lines are kept in memory and written to the stream with a single
+        write and flush when the block exits, instead of one write (and, on
+        line-buffered terminals, one flush) per line.
+        """
+        stream = self._stream
+        self._stream = io.StringIO()
+        try:
+            yield
+        finally:
+            contents = self._stream.getvalue()
+            self._stream = stream
+            if contents:
+                stream.write(contents)
+                stream.flush()
+
     def close(self) -> None:
         """
         Flush any remaining content and close the stream.
@@ -102,5 +185,5 @@ class StreamWriter:
         self.flush()
 
         # Close the stream if it has a close method
-        if hasattr(self._stream, "close"):
-            self._stream.close()
+        if self._close is not None:
+            self._close()
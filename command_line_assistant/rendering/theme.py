@@ -1,7 +1,7 @@
 import logging
 import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from command_line_assistant.rendering.colors import Color
 
@@ -46,35 +46,31 @@ class Theme:
     image: Color = Color.BRIGHT_BLUE
     horizontal_rule: Color = Color.BRIGHT_BLACK
 
+    #: Configuration section and name of every color that can be overridden.
+    _CONFIG_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("colors", "info"),
+        ("colors", "warning"),
+        ("colors", "notice"),
+        ("colors", "error"),
+        ("markdown", "inline_code"),
+        ("markdown", "code_block_line"),
+        ("markdown", "code_block_border"),
+        ("markdown", "header"),
+        ("markdown", "link"),
+        ("markdown", "image"),
+        ("markdown", "horizontal_rule"),
+    )
+
     def __init__(self, config: Optional[dict] = None):
         """Initialize a theme.
 
         Args:
             config (dict): The configuration for the theme.
         """
-        if config is not None:
-            if "colors" in config:
-                self.info = config["colors"]["info"]
-                self.warning = config["colors"]["warning"]
-                self.notice = config["colors"]["notice"]
-                self.error = config["colors"]["error"]
-            if "markdown" in config:
-                self.inline_code = config["markdown"]["inline_code"]
-                self.code_block_line = config["markdown"]["code_block_line"]
-                self.code_block_border = config["markdown"]["code_block_border"]
-                self.header = config["markdown"]["header"]
-                self.link = config["markdown"]["link"]
-                self.image = config["markdown"]["image"]
-                self.horizontal_rule = config["markdown"]["horizontal_rule"]
+        if config is None:
+            return
 
-            self.info = Color.from_string(self.info)
-            self.warning = Color.from_string(self.warning)
-            self.notice = Color.from_string(self.notice)
-            self.error = Color.from_string(self.error)
-            self.inline_code = Color.from_string(self.inline_code)
-            self.code_block_line = Color.from_string(self.code_block_line)
-            self.code_block_border = Color.from_string(self.code_block_border)
-            self.header = Color.from_string(self.header)
-            self.link = Color.from_string(self.link)
-            self.image = Color.from_string(self.image)
-            self.horizontal_rule = Color.from_string(self.horizontal_rule)
+        for section, name in self._CONFIG_FIELDS:
+            value = config.get(section, {}).get(name)
+            if value is not None:
+                setattr(self, name, Color.from_string(value))
@@ -1,5 +1,6 @@
 """Terminal module to hold the parsing functions and constants."""
 
+import functools
 import json
 import logging
 import re
@@ -9,6 +10,9 @@ from command_line_assistant.terminal.reader import TERMINAL_CAPTURE_FILE
 #: The compiled regex to clean the ANSI escape sequence
 ANSI_ESCAPE_SEQ = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
+#: Texts shorter than this are cleaned through a cache. Commands are short and
+#: often repeated, while long outputs would only evict them.
+CLEAN_CACHE_MAX_LENGTH: int = 256
 
 logger = logging.getLogger(__name__)
 
@@ -29,23 +33,25 @@ def parse_terminal_output() -> list[dict[str, str]]:
         )
         return result
 
-    with TERMINAL_CAPTURE_FILE.open(mode="r") as handler:
-        for block in handler:
-            # Parse the JSON
-            try:
-                parsed = json.loads(block)
-                parsed["command"] = clean_parsed_text(parsed["command"])
-                parsed["output"] = clean_parsed_text(parsed["output"])
-                # Just ignore the exit at the end.
-                if parsed["output"].endswith("exit"):
-                    continue
-                result.append(parsed)
-            except json.JSONDecodeError as e:
-                logger.info(
-                    "Couldn't deserialize the json output. Returning empty list. %s",
-                    str(e),
-                )
-                return result
+    # Read the whole log at once and hand the raw lines to `json.loads`, which
+    # decodes bytes itself, instead of decoding and iterating the file line by
+    # line through the text layer.
+    for block in TERMINAL_CAPTURE_FILE.read_bytes().splitlines():
+        # Parse the JSON
+        try:
+            parsed = json.loads(block)
+            parsed["command"] = clean_parsed_text(parsed["command"])
+            parsed["output"] = clean_parsed_text(parsed["output"])
+            # Just ignore the exit at the end.
+            if parsed["output"].endswith("exit"):
+                continue
+            result.append(parsed)
+        except json.JSONDecodeError as e:
+            logger.info(
+                "Couldn't deserialize the json output. Returning empty list. %s",
+                str(e),
+            )
+            return result
 
     return result
 
@@ -82,6 +88,23 @@ def clean_parsed_text(text: str) -> str:
     Returns:
         str: The cleaned string.
     """
-    # Remove ANSI escape sequences
-    cleaned_ansi_escape_seq = ANSI_ESCAPE_SEQ.sub("", text)
-    return cleaned_ansi_escape_seq.strip()
+    if len(text) < CLEAN_CACHE_MAX_LENGTH:
+        return _clean_cached(text)
+
+    return _clean(text)
+
+
+def _clean(text: str) -> str:
+    """Remove ANSI escape sequences and surrounding whitespace from text.
+
+    Arguments:
+        text (str): The text to clean.
+
+    Returns:
+        str: The cleaned string.
+    """
+    return ANSI_ESCAPE_SEQ.sub("", text).strip()
+
+
+#: Cached variant of `py:_clean` for short, repetitive inputs.
+_clean_cached = functools.lru_cache(maxsize=512)(_clean)
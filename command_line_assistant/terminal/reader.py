@@ -6,10 +6,11 @@ import logging
 import os
 import pty
 import shutil
+import signal
 import struct
 import termios
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, Any, Optional
 
 from command_line_assistant.utils.environment import get_xdg_state_path
 from command_line_assistant.utils.files import create_folder, write_file
@@ -35,10 +36,13 @@ class TerminalRecorder:
         """
         self._handler = handler
         self._winsize = winsize
+        self._master_fd: Optional[int] = None
 
         self._in_command: bool = True
-        self._current_command: bytes = b""
-        self._current_output: bytes = b""
+        # Both grow with every read from the pty; a bytearray extends in place
+        # instead of copying everything captured so far on each read.
+        self._current_command: bytearray = bytearray()
+        self._current_output: bytearray = bytearray()
         self._prompt_marker: bytes = PROMPT_MARKER.encode()
 
     def write_json_block(self):
@@ -50,8 +54,20 @@ class TerminalRecorder:
             }
             self._handler.write(json.dumps(block).encode() + b"\n")
             self._handler.flush()
-            self._current_command = b""
-            self._current_output = b""
+            self._current_command = bytearray()
+            self._current_output = bytearray()
+
+    def handle_resize(self, signum: int, frame: Any) -> None:
+        """Signal handler that forwards terminal resizes to the pty.
+
+        Arguments:
+            signum (int): The signal number (SIGWINCH).
+            frame (Any): The current stack frame.
+        """
+        columns, lines = shutil.get_terminal_size()
+        self._winsize = struct.pack("HHHH", lines, columns, 0, 0)
+        if self._master_fd is not None:
+            fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, self._winsize)
 
     def read(self, fd: int) -> bytes:
         """Callback method that is used to read data from pty.
@@ -62,7 +78,11 @@ class TerminalRecorder:
         Returns:
             bytes: The data read from the terminal
         """
-        fcntl.ioctl(fd, termios.TIOCSWINSZ, self._winsize)
+        # The window size only needs to be set once on the pty, resizes are
+        # handled by `handle_resize`.
+        if self._master_fd != fd:
+            self._master_fd = fd
+            fcntl.ioctl(fd, termios.TIOCSWINSZ, self._winsize)
 
         data = os.read(fd, 4096)
         if data.startswith(self._prompt_marker):
@@ -74,9 +94,9 @@ class TerminalRecorder:
 
         # Store command or output
         if self._in_command:
-            self._current_command += data
+            self._current_command.extend(data)
         else:
-            self._current_output += data
+            self._current_output.extend(data)
 
         return data
 
@@ -122,7 +142,11 @@ def start_capturing() -> None:
             )
 
             # Instantiate the TerminalRecorder and spawn a new shell with pty.
-            pty.spawn([shell], recorder.read)
+            previous_handler = signal.signal(signal.SIGWINCH, recorder.handle_resize)
+            try:
+                pty.spawn([shell], recorder.read)
+            finally:
+                signal.signal(signal.SIGWINCH, previous_handler)
 
             # Write the final json block if it exists.
             recorder.write_json_block()
@@ -4,18 +4,34 @@ import json
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Collection, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class _LazyJSON:
+    """Serialize a dictionary to JSON only when it gets formatted.
+
+    Handlers and filters may still drop a debug record after the logger
+    accepted it, in which case the serialization never happens.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return json.dumps(self.data)
+
+
 class TimingLogger:
     """Specialized logger class for timing function execution.
 
     This class provides detailed timing information for function calls, including:
     - Function name and arguments
-    - Monotonic time (wall clock time)
-    - Performance counter time (CPU time)
+    - Performance counter time (wall clock time)
+    - Thread CPU time
     - Custom timing messages
 
     Example:
@@ -36,28 +52,27 @@ class TimingLogger:
             filtered_params (Optional[list[str]], optional): List of parameter names to be redacted in logs
         """
         self.filtered_params = filtered_params or []
+        self._filtered_params = frozenset(self.filtered_params)
 
     def _sanitize_value(
         self,
         key: str,
         value: Any,
-        additional_filtered_params: Optional[list[str]] = None,
+        additional_filtered_params: Optional[Collection[str]] = None,
     ) -> str:
         """Sanitize values based on filtered parameters.
 
         Arguments:
             key (str): Parameter name
             value (Any): Parameter value
-            additional_filtered_params (Optional[list[str]], optional): Additional parameters to filter
+            additional_filtered_params (Optional[Collection[str]], optional): Additional parameters to filter
 
         Returns:
             str: Original value as string or "redacted" if parameter should be filtered
         """
-        all_filtered_params = set(self.filtered_params)
-        if additional_filtered_params:
-            all_filtered_params.update(additional_filtered_params)
-
-        if key in all_filtered_params:
+        if key in self._filtered_params or (
+            additional_filtered_params and key in additional_filtered_params
+        ):
             return "redacted"
 
         # Handle different types of values
@@ -76,7 +91,7 @@ class TimingLogger:
         kwargs: dict,
         duration: float,
         cpu_time: float,
-        filtered_params: Optional[list[str]] = None,
+        filtered_params: Optional[Collection[str]] = None,
         message: Optional[str] = None,
     ) -> None:
         """Internal method to log timing information.
@@ -87,7 +102,7 @@ class TimingLogger:
             kwargs (dict): Keyword arguments passed to the function
             duration (float): Wall clock duration in milliseconds
             cpu_time (float): CPU time duration in milliseconds
-            filtered_params (Optional[list[str]], optional): Additional parameters to filter
+            filtered_params (Optional[Collection[str]], optional): Additional parameters to filter
             message (Optional[str]): Optional custom message to include in log
         """
         timing_data = {
@@ -112,7 +127,7 @@ class TimingLogger:
         if message:
             timing_data["message"] = message
 
-        logger.debug(json.dumps(timing_data))
+        logger.debug("%s", _LazyJSON(timing_data))
 
     def timeit(
         self,
@@ -140,22 +155,30 @@ class TimingLogger:
 
         def decorator(func: Callable) -> Callable:
             """Decorator internal function that receives the outer function"""
+            # Built once per decorated function rather than for every argument
+            # of every call.
+            additional_filtered_params = frozenset(filtered_params or ())
 
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Wrapper function to handle the outer real function"""
-                time_start = time.monotonic_ns()
+                # The timing is only ever logged at debug level, so don't pay
+                # for it when nobody will see the record.
+                if not logger.isEnabledFor(logging.DEBUG):
+                    return func(*args, **kwargs)
+
                 perf_start = time.perf_counter_ns()
+                cpu_start = time.thread_time_ns()
 
                 try:
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    time_end = time.monotonic_ns()
                     perf_end = time.perf_counter_ns()
+                    cpu_end = time.thread_time_ns()
 
-                    duration = (time_end - time_start) / 1e6  # Convert to milliseconds
-                    cpu_time = (perf_end - perf_start) / 1e6  # Convert to milliseconds
+                    duration = (perf_end - perf_start) / 1e6  # Convert to milliseconds
+                    cpu_time = (cpu_end - cpu_start) / 1e6  # Convert to milliseconds
 
                     self._log_timing(
                         func_name=func.__name__,
@@ -163,7 +186,7 @@ class TimingLogger:
                         kwargs=kwargs,
                         duration=duration,
                         cpu_time=cpu_time,
-                        filtered_params=filtered_params,
+                        filtered_params=additional_filtered_params,
                     )
 
             return wrapper
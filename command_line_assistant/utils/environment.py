@@ -2,17 +2,33 @@
 Utilitary module to interact with environment variables.
 """
 
+import functools
 import os
 from pathlib import Path
 
 #: The wanted xdg path where the configuration files will live.
 WANTED_XDG_PATH = Path("/etc/xdg")
 
-#: The wanted xdg state path in case $XDG_STATE_HOME is not defined.
-WANTED_XDG_STATE_PATH = Path("~/.local/state/command-line-assistant").expanduser()
+#: The wanted xdg state path in case $XDG_STATE_HOME is not defined. The user
+#: home is only expanded when the fallback is actually used.
+WANTED_XDG_STATE_PATH = Path("~/.local/state/command-line-assistant")
 
-#: The wanted xdg data path in case $XDG_DATA_HOME is not defined.
-WANTED_XDG_DATA_PATH = Path("~/.local/share/command-line-assistant").expanduser()
+#: The wanted xdg data path in case $XDG_DATA_HOME is not defined. The user
+#: home is only expanded when the fallback is actually used.
+WANTED_XDG_DATA_PATH = Path("~/.local/share/command-line-assistant")
+
+
+@functools.lru_cache(maxsize=2)
+def _expand_wanted_path(path: Path) -> Path:
+    """Expand the user home of one of the wanted fallback paths.
+
+    Arguments:
+        path (Path): The fallback path, possibly starting with "~"
+
+    Returns:
+        Path: The path with the user home expanded
+    """
+    return path.expanduser()
 
 
 def get_xdg_state_path() -> Path:
@@ -20,18 +36,30 @@ def get_xdg_state_path() -> Path:
 
     In case it is not present, this function will return the default path that
     is `~/.local/state`, which is where we want to place temporary state files for
-    Command Line Assistant.
+    Command Line Assistant. Otherwise, the path built from it is memoized per
+    value.
 
     See: https://specifications.freedesktop.org/basedir-spec/latest/
     """
     xdg_state_home = os.getenv("XDG_STATE_HOME", "")
+    if xdg_state_home:
+        return _xdg_state_path(xdg_state_home)
+
+    return _expand_wanted_path(WANTED_XDG_STATE_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def _xdg_state_path(xdg_state_home: str) -> Path:
+    """Build the state path for a given $XDG_STATE_HOME value.
 
+    Arguments:
+        xdg_state_home (str): The value of $XDG_STATE_HOME
+
+    Returns:
+        Path: The Command Line Assistant state path
+    """
     # We call expanduser() for the xdg_state_home in case someone do "~/"
-    return (
-        Path(xdg_state_home, "command-line-assistant").expanduser()
-        if xdg_state_home
-        else WANTED_XDG_STATE_PATH
-    )
+    return Path(xdg_state_home, "command-line-assistant").expanduser()
 
 
 def get_xdg_data_path() -> Path:
@@ -39,14 +67,30 @@ def get_xdg_data_path() -> Path:
 
     In case it is not present, this function will return the default path that
     is `~/.local/share`, which is where we want to place data files for
-    Command Line Assistant.
+    Command Line Assistant. Otherwise, the path built from it is memoized per
+    value.
 
     See: https://specifications.freedesktop.org/basedir-spec/latest/
     """
     xdg_data_home = os.getenv("XDG_DATA_HOME", "")
+    if xdg_data_home:
+        return _xdg_data_path(xdg_data_home)
+
+    return _expand_wanted_path(WANTED_XDG_DATA_PATH)
 
+
+@functools.lru_cache(maxsize=1)
+def _xdg_data_path(xdg_data_home: str) -> Path:
+    """Build the data path for a given $XDG_DATA_HOME value.
+
+    Arguments:
+        xdg_data_home (str): The value of $XDG_DATA_HOME
+
+    Returns:
+        Path: The Command Line Assistant data path
+    """
     # We call expanduser() for the xdg_data_home in case someone do "~/"
-    return Path(xdg_data_home).expanduser() if xdg_data_home else WANTED_XDG_DATA_PATH
+    return Path(xdg_data_home).expanduser()
 
 
 def get_xdg_config_path() -> Path:
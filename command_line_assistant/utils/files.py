@@ -1,12 +1,9 @@
 """Utilitary module to handle file operations"""
 
-import errno
-import fcntl
+import functools
 import logging
-import mimetypes
 import os
 import stat
-import tempfile
 from io import TextIOWrapper
 from pathlib import Path
 from typing import Optional, Union
@@ -16,6 +13,45 @@ from command_line_assistant.utils.environment import get_xdg_state_path
 logger = logging.getLogger(__name__)
 
 
+def normalize_newlines(text: str) -> str:
+    """Translate "\\r\\n" and lone "\\r" line endings to "\\n".
+
+    This matches the universal newlines translation done by text-mode
+    streams, for text that was decoded from raw bytes.
+
+    Arguments:
+        text (str): The decoded text
+
+    Returns:
+        str: The text with normalized line endings
+    """
+    if "\r" not in text:
+        return text
+
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mimetype_by_suffixes(suffixes: str) -> Optional[str]:
+    """Guess the mimetype for a given chain of file suffixes.
+
+    Note:
+        The mimetype only depends on the suffixes (".tar.gz" included), so
+        caching on them spares the extension map walk for repeated file types.
+
+    Arguments:
+        suffixes (str): All the suffixes of a file name, e.g. ".txt".
+
+    Returns:
+        Optional[str]: The guessed mimetype or None if not found.
+    """
+    # Deferred as loading the module reads the system mime.types databases,
+    # which only attachments need.
+    import mimetypes
+
+    return mimetypes.guess_type(f"file{suffixes}")[0]
+
+
 def guess_mimetype(attachment: Optional[TextIOWrapper]) -> str:
     """Guess the mimetype of a given attachment.
 
@@ -30,10 +66,11 @@ def guess_mimetype(attachment: Optional[TextIOWrapper]) -> str:
     if not attachment:
         return unknown_mimetype
 
-    path = Path(attachment.name)
-    result = mimetypes.guess_type(path)
-
-    mimetype = result[0]
+    # Plain string operations on the name, no Path object needed to find
+    # where the suffixes start.
+    name = os.path.basename(attachment.name).lstrip(".")
+    dot = name.find(".")
+    mimetype = _guess_mimetype_by_suffixes(name[dot:] if dot != -1 else "")
     if not mimetype:
         return unknown_mimetype
 
@@ -54,14 +91,8 @@ def create_folder(path: Path, parents: bool = False, mode: int = 0o700) -> None:
         mode (int): The permissions of the given folder. Defaults to 0700.
     """
     try:
-        if not path.exists():
-            logger.debug(
-                "Directory %s does not exist. Creating it with permissions %s",
-                path,
-                mode,
-            )
-
         path.mkdir(mode=mode, parents=parents)
+        logger.debug("Created directory %s with permissions %s", path, mode)
     except (FileExistsError, FileNotFoundError) as e:
         logger.info(
             "Skipping directory creation at '%s' as we found an exception %s. It's possible that the folder already exists or is a race condition.",
@@ -83,17 +114,19 @@ def write_file(contents: Union[str, bytes], path: Path, mode: int = 0o600) -> No
         path (Path): The path of the file that needs to be created.
         mode (int): The permissions of the given file. Defaults to 0600.
     """
-    try:
-        logger.debug(
-            "File %s does not exist. Creating it with permissions %s", path, mode
-        )
-
-        if isinstance(contents, bytes):
-            path.write_bytes(contents)
-        else:
-            path.write_text(contents)
+    data = contents if isinstance(contents, bytes) else contents.encode()
 
-        path.chmod(mode)
+    try:
+        logger.debug("Writing file %s with permissions %s", path, mode)
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        # The file object owns the descriptor from here on and its write()
+        # keeps going until every byte is written, unlike a bare os.write().
+        with os.fdopen(fd, "wb") as handler:
+            # The mode given to os.open() only applies to new files and is
+            # masked by the umask, so enforce it on the open descriptor.
+            os.fchmod(fd, mode)
+            handler.write(data)
     except (FileExistsError, FileNotFoundError) as e:
         logger.info(
             "Skipping file creation at '%s' as we found an exception %s. It's possible that the file already exists or is a race condition.",
@@ -117,7 +150,6 @@ class NamedFileLock:
     def __init__(self, name: str) -> None:
         """Initialize the named file lock mechanism."""
         self._pid: int = os.getpid()
-        self._name: str = name.replace("-", "_")
         self._lock_file: Path = Path(get_xdg_state_path(), name + ".lock")
 
     @property
@@ -139,17 +171,26 @@ class NamedFileLock:
         Returns:
             bool: True if a lock is active, False otherwise
         """
-        if not self._lock_file.exists():
+        try:
+            fd = os.open(self._lock_file, os.O_RDONLY)
+        except FileNotFoundError:
             return False
 
         try:
-            pid = int(self._lock_file.read_text().strip())
+            # A pid is a handful of digits, so one small read is enough.
+            contents = os.read(fd, 32).strip()
+        finally:
+            os.close(fd)
+
+        try:
+            pid = int(contents)
             # Check if process is still running. Sending signal 0 to a process
             # will raise an OSError if no process with that pid is running.
             os.kill(pid, 0)
             return True
-        except (ValueError, FileNotFoundError):
-            # Clean up stale lock file
+        except ValueError:
+            # Clean up stale lock file. The pid is published atomically by
+            # acquire(), so an empty or garbled file is never a live lock.
             self._lock_file.unlink(missing_ok=True)
             return False
 
@@ -159,32 +200,39 @@ class NamedFileLock:
         Raises:
             RuntimeError: If a lock is already active
         """
+        already_locked = (
+            "A lock is already active in another process. "
+            "Please, remove the lock before trying to acquire again."
+        )
         if self.is_locked:
-            raise RuntimeError(
-                "A lock is already active in another process. "
-                "Please, remove the lock before trying to acquire again."
-            )
+            raise RuntimeError(already_locked)
 
         create_folder(self._lock_file.parent, parents=True)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".pid", prefix=self._name, dir=self._lock_file.parent
-        ) as handler:
-            # Write current process ID
-            handler.write(str(os.getpid()))
-            handler.flush()
-
+        # Write the pid to a private file first and then hard link it in
+        # place, so the lock file is never visible without the pid of its
+        # owner. os.link() fails if the lock file exists, which makes the
+        # creation atomic even when two processes passed the check above.
+        temp_file = self._lock_file.with_name(f"{self._lock_file.name}.{os.getpid()}")
+        try:
             # stat.S_IRUSR = Owner has read permission
             # stat.S_IWUSR = Owner has write permission
-            os.chmod(handler.name, stat.S_IRUSR | stat.S_IWUSR)
-            # Use fcntl for file locking
-            fcntl.flock(handler.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-
+            fd = os.open(
+                temp_file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                stat.S_IRUSR | stat.S_IWUSR,
+            )
             try:
-                os.link(handler.name, self._lock_file)
-            except FileExistsError as e:
-                if e.errno != errno.EEXIST:
-                    raise
+                # Write current process ID
+                os.write(fd, str(os.getpid()).encode())
+            finally:
+                os.close(fd)
+
+            os.link(temp_file, self._lock_file)
+        except FileExistsError as e:
+            raise RuntimeError(already_locked) from e
+        finally:
+            temp_file.unlink(missing_ok=True)
 
     def release(self) -> None:
         """Release the terminal lock."""
@@ -429,6 +429,17 @@ def test_parse_attachment_file_success(tmp_path):
     assert result == "test content"
 
 
+def test_parse_attachment_file_crlf(tmp_path):
+    """Test that CRLF line endings are translated when parsing attachments."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(b"line1\r\nline2\r\n")
+
+    with open(file_path, "r") as f:
+        result = chat._parse_attachment_file(f)
+
+    assert result == "line1\nline2"
+
+
 def test_parse_attachment_file_none():
     """Test parsing None attachment."""
     result = chat._parse_attachment_file(None)
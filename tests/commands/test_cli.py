@@ -1,6 +1,8 @@
+import io
+import os
 import select
 import sys
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -30,6 +32,13 @@ REDHAT_SUPPORT_PRODUCT_VERSION="10.0 Beta"
 """
 
 
+@pytest.fixture(autouse=True)
+def clear_os_release_cache():
+    cli._load_os_release.cache_clear()
+    yield
+    cli._load_os_release.cache_clear()
+
+
 def test_command_context_initialization():
     command_context = cli.CommandContext()
     assert isinstance(command_context.username, str)
@@ -38,10 +47,34 @@ def test_command_context_initialization():
     assert command_context.os_release
 
 
+def test_default_username_from_environment(monkeypatch):
+    monkeypatch.setenv("LOGNAME", "alice")
+    monkeypatch.setenv("USER", "bob")
+
+    assert cli.CommandContext().username == "alice"
+
+
+def test_default_username_uses_getpass():
+    with patch("getpass.getuser", return_value="bob"):
+        assert cli.CommandContext().username == "bob"
+
+
+def test_effective_user_id_default():
+    field = cli.CommandContext.__dataclass_fields__["effective_user_id"]
+
+    assert field.default_factory is os.geteuid
+    assert cli.CommandContext().effective_user_id == os.geteuid()
+
+
 def test_command_context_os_release_not_found(tmp_path):
     os_release = tmp_path / "not_found"
 
-    with patch("command_line_assistant.commands.cli.OS_RELEASE_PATH", os_release):
+    with (
+        patch("command_line_assistant.commands.cli.OS_RELEASE_PATH", os_release),
+        patch(
+            "command_line_assistant.commands.cli.OS_RELEASE_FALLBACK_PATH", os_release
+        ),
+    ):
         with pytest.raises(ValueError, match="OS Release file not found"):
             cli.CommandContext()
 
@@ -56,36 +89,125 @@ def test_command_context_parse_os_release(tmp_path):
         assert context.os_release["name"] == "Red Hat Enterprise Linux"
 
 
-def test_read_stdin(monkeypatch):
-    # Mock select.select to simulate user input
-    def mock_select(*args, **kwargs):
-        return [sys.stdin], [], []
+@pytest.mark.parametrize(
+    ("contents", "expected"),
+    (
+        ('ID="rhel"\n', {"id": "rhel"}),
+        ("ID='rhel'\n", {"id": "rhel"}),
+        ("VERSION_ID=10.0\n", {"version_id": "10.0"}),
+        ('# NAME="ignored"\n\nID=fedora\n', {"id": "fedora"}),
+        ('  NAME="Red Hat"\n', {"name": "Red Hat"}),
+        ('EMPTY=""\n', {"empty": ""}),
+        ("NAME=Red Hat\n", {"name": "Red Hat"}),
+        ('ID="rhel" \n', {"id": "rhel"}),
+        ('NAME="Say \\"hi\\" \\\\ \\$HOME"\n', {"name": 'Say "hi" \\ $HOME'}),
+    ),
+)
+def test_load_os_release(tmp_path, contents, expected):
+    os_release_file = tmp_path / "os-release"
+    os_release_file.write_text(contents)
+    with patch("command_line_assistant.commands.cli.OS_RELEASE_PATH", os_release_file):
+        assert cli._load_os_release() == expected
 
-    monkeypatch.setattr(select, "select", mock_select)
 
-    # Mock sys.stdin.readline to return the desired input
-    monkeypatch.setattr(sys.stdin, "read", lambda: "test\n")
+def test_command_context_os_release_fallback(tmp_path):
+    os_release_file = tmp_path / "os-release"
+    os_release_file.write_text(MOCK_OS_RELEASE)
+    with (
+        patch(
+            "command_line_assistant.commands.cli.OS_RELEASE_PATH",
+            tmp_path / "not_found",
+        ),
+        patch(
+            "command_line_assistant.commands.cli.OS_RELEASE_FALLBACK_PATH",
+            os_release_file,
+        ),
+    ):
+        assert cli.CommandContext().os_release["id"] == "rhel"
+
+
+def test_command_context_os_release_read_once(tmp_path):
+    os_release_file = tmp_path / "os-release"
+    os_release_file.write_text(MOCK_OS_RELEASE)
+    with patch("command_line_assistant.commands.cli.OS_RELEASE_PATH", os_release_file):
+        first = cli.CommandContext()
+        os_release_file.unlink()
+        second = cli.CommandContext()
+
+    assert first.os_release == second.os_release
+    assert first.os_release is not second.os_release
+
+
+@pytest.fixture
+def mock_poll(monkeypatch):
+    poller = Mock()
+    monkeypatch.setattr(select, "poll", Mock(return_value=poller))
+    return poller
+
+
+def test_read_stdin(monkeypatch, mock_poll):
+    # Mock the poll object to simulate user input
+    mock_poll.poll.return_value = [(0, select.POLLIN)]
+
+    # Mock sys.stdin to return the desired input
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"  test\n")))
 
     assert cli.read_stdin() == "test"
+    mock_poll.register.assert_called_once_with(sys.stdin, select.POLLIN)
+    mock_poll.poll.assert_called_once_with(0)
 
 
-def test_read_stdin_no_input(monkeypatch):
-    # Mock select.select to simulate user input
-    def mock_select(*args, **kwargs):
-        return [], [], []
+@pytest.mark.parametrize(
+    ("raw", "encoding", "errors", "expected"),
+    (
+        (b"line1\r\nline2\rline3\r\n", "utf-8", "strict", "line1\nline2\nline3"),
+        ("\u00a0 text \u00a0\n".encode(), "utf-8", "strict", "text"),
+        (b"caf\xe9\n", "ascii", "surrogateescape", "caf\udce9"),
+    ),
+)
+def test_read_stdin_matches_text_layer(
+    monkeypatch, mock_poll, raw, encoding, errors, expected
+):
+    mock_poll.poll.return_value = [(0, select.POLLIN)]
+    monkeypatch.setattr(
+        sys,
+        "stdin",
+        io.TextIOWrapper(io.BytesIO(raw), encoding=encoding, errors=errors),
+    )
+
+    assert cli.read_stdin() == expected
 
-    monkeypatch.setattr(select, "select", mock_select)
+
+def test_read_stdin_no_input(mock_poll):
+    mock_poll.poll.return_value = []
 
     assert not cli.read_stdin()
 
 
-def test_read_stdin_value_error(monkeypatch):
-    # Mock select.select to simulate user input
+def test_read_stdin_tty_skips_poll(monkeypatch, mock_poll):
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: True)
+
+    assert cli.read_stdin() == ""
+    mock_poll.poll.assert_not_called()
+
+
+def test_read_stdin_without_poll(monkeypatch):
+    # Mock select.select to simulate user input on platforms without poll
     def mock_select(*args, **kwargs):
         return [sys.stdin], [], []
 
+    monkeypatch.delattr(select, "poll")
     monkeypatch.setattr(select, "select", mock_select)
-    monkeypatch.setattr(sys.stdin, "read", lambda: b"'\x80abc'".decode())
+    monkeypatch.setattr(sys, "stdin", io.StringIO("test\n"))
+
+    assert cli.read_stdin() == "test"
+
+
+def test_read_stdin_value_error(monkeypatch, mock_poll):
+    mock_poll.poll.return_value = [(0, select.POLLIN)]
+    monkeypatch.setattr(
+        sys, "stdin", io.TextIOWrapper(io.BytesIO(b"'\x80abc'"), encoding="utf-8")
+    )
 
     with pytest.raises(ValueError, match="Binary input are not supported."):
         cli.read_stdin()
@@ -118,22 +240,20 @@ def test_create_argument_parser():
         (["/usr/bin/c", "test query"], None, ["chat", "test query"]),
         (["/usr/bin/c", "history"], None, ["history"]),
         (["/usr/bin/c", "shell"], None, ["shell"]),
+        (
+            ["c", "--debug", "history", "--clear"],
+            None,
+            ["--debug", "history", "--clear"],
+        ),
+        (
+            ["c", "--plain", "how to list files?"],
+            None,
+            ["--plain", "chat", "how to list files?"],
+        ),
+        (["c", "--version"], None, ["--version", "chat"]),
+        (["c", "feedback"], None, ["feedback"]),
     ],
 )
 def test_add_default_command(args, stdin, expected):
     """Test adding default 'query' command when no command is specified"""
     assert cli.add_default_command(stdin, args) == expected
-
-
-@pytest.mark.parametrize(
-    ("argv", "expected"),
-    (
-        (["chat"], "chat"),
-        (["--debug"], None),
-        (["--version"], None),
-        (["--help"], None),
-        (["--clear"], None),
-    ),
-)
-def test_subcommand_used(argv, expected):
-    assert cli._subcommand_used(argv) == expected
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 import responses
@@ -58,6 +58,16 @@ def test_handle_query_raising_status_from_gateway(mock_config, default_payload):
         query.submit(default_payload, config=mock_config)
 
 
+def test_handle_error_response_decodes_body_once():
+    response = Mock(status_code=404, reason="Not Found")
+    response.json.return_value = {"errors": [{"status": 404, "detail": "Not found"}]}
+
+    with pytest.raises(RequestFailedError, match="Not found"):
+        query._handle_error_response(response)
+
+    response.json.assert_called_once_with()
+
+
 @responses.activate
 def test_submit_empty_query(mock_config):
     """Test submitting an empty query"""
@@ -221,8 +231,10 @@ def test_handle_error_response_invalid_json(
 def test_submit_with_rhsm_cert_oserror(mock_config, default_payload):
     """Test that OSError with RHSM certificate path raises specific error message"""
     # Mock the session to raise OSError with the specific path
-    with patch("command_line_assistant.daemon.http.query.get_session") as mock_session:
-        mock_session.return_value.__enter__.return_value.post.side_effect = OSError(
+    with patch(
+        "command_line_assistant.daemon.http.query.get_shared_session"
+    ) as mock_session:
+        mock_session.return_value.post.side_effect = OSError(
             "Could not read SSL certificate file: /etc/pki/consumer/cert.pem"
         )
 
@@ -236,11 +248,11 @@ def test_submit_with_rhsm_cert_oserror(mock_config, default_payload):
 def test_submit_with_generic_oserror(mock_config, default_payload):
     """Test that OSError without RHSM certificate path is re-raised as is"""
     # Mock the session to raise a generic OSError
-    with patch("command_line_assistant.daemon.http.query.get_session") as mock_session:
+    with patch(
+        "command_line_assistant.daemon.http.query.get_shared_session"
+    ) as mock_session:
         original_error = OSError("Generic OS error")
-        mock_session.return_value.__enter__.return_value.post.side_effect = (
-            original_error
-        )
+        mock_session.return_value.post.side_effect = original_error
 
         with pytest.raises(OSError, match="Generic OS error"):
             query.submit(default_payload, config=mock_config)
@@ -3,7 +3,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from command_line_assistant.constants import VERSION
-from command_line_assistant.daemon.http.session import get_session
+from command_line_assistant.daemon.http.session import (
+    get_session,
+    get_shared_session,
+)
 
 
 def test_session_headers(mock_config):
@@ -74,3 +77,22 @@ def test_session_with_proxies(proxies, mock_config):
     session = get_session(mock_config)
 
     assert session.proxies == proxies
+
+
+def test_shared_session_is_reused(mock_config):
+    session = get_shared_session(mock_config)
+
+    assert get_shared_session(mock_config) is session
+
+
+def test_shared_session_rebuilt_for_new_config(mock_config):
+    session = get_shared_session(mock_config)
+    other_config = MagicMock()
+    other_config.backend.endpoint = "http://localhost"
+    other_config.backend.proxies = {}
+
+    with patch.object(session, "close") as mock_close:
+        other_session = get_shared_session(other_config)
+
+    assert other_session is not session
+    mock_close.assert_called_once()
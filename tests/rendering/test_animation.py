@@ -0,0 +1,106 @@
+from unittest.mock import Mock
+
+import pytest
+
+from command_line_assistant.rendering.animation import (
+    ASCII_SPINNER_FRAMES,
+    SPINNER_FRAMES,
+    Spinner,
+    _frames_for_encoding,
+)
+
+
+def test_next_frame_wraps_around():
+    spinner = Spinner(message="Loading")
+    frames = [spinner._next_frame() for _ in range(len(SPINNER_FRAMES) + 1)]
+
+    assert frames[:-1] == list(SPINNER_FRAMES)
+    assert frames[-1] == SPINNER_FRAMES[0]
+
+
+def test_frames_are_not_shared_between_instances():
+    first = Spinner(message="Loading")
+    second = Spinner(message="Loading")
+
+    first._next_frame()
+    first._next_frame()
+
+    assert second._next_frame() == SPINNER_FRAMES[0]
+
+
+def test_plain_spinner(capsys):
+    with Spinner(message="Loading", plain=True):
+        pass
+
+    captured = capsys.readouterr()
+    assert captured.err == f"{SPINNER_FRAMES[0]} Loading...\n"
+
+
+def test_spinner_is_noop_without_tty(capsys):
+    spinner = Spinner(message="Loading")
+    with spinner:
+        assert not spinner._spinning
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+
+def test_animate_writes_frames(capsys):
+    spinner = Spinner(message="Loading")
+    spinner._stop_event = Mock()
+    spinner._stop_event.wait.side_effect = [False, True]
+
+    spinner._animate()
+
+    captured = capsys.readouterr()
+    assert captured.err == (
+        f"\r{SPINNER_FRAMES[0]} Loading...\r{SPINNER_FRAMES[1]} Loading..."
+    )
+
+
+def test_animate_stops_without_waiting_full_interval():
+    spinner = Spinner(message="Loading")
+    spinner._stop_event = Mock()
+    spinner._stop_event.wait.return_value = True
+
+    spinner._animate()
+
+    spinner._stop_event.wait.assert_called_once_with(0.1)
+
+
+def test_render_frames_clears_only_when_shorter():
+    rendered = Spinner._render_frames(("ab", "a", "ab"), " Loading...")
+
+    assert rendered == (
+        "\rab Loading...",
+        "\r" + " " * len("ab Loading...") + "\ra Loading...",
+        "\rab Loading...",
+    )
+
+
+@pytest.mark.parametrize(
+    ("encoding", "expected"),
+    (
+        ("utf-8", SPINNER_FRAMES),
+        ("ascii", ASCII_SPINNER_FRAMES),
+        ("iso8859-1", ASCII_SPINNER_FRAMES),
+    ),
+)
+def test_frames_for_encoding(encoding, expected):
+    assert _frames_for_encoding(encoding) == expected
+
+
+def test_animate_writes_encoded_frames_to_fd(tmp_path, monkeypatch):
+    err_file = tmp_path / "stderr"
+    with err_file.open("w", encoding="utf-8") as stderr:
+        monkeypatch.setattr("sys.stderr", stderr)
+        stderr.write("pending")
+        spinner = Spinner(message="Loading")
+        spinner._stop_event = Mock()
+        spinner._stop_event.wait.side_effect = [False, True]
+
+        spinner._animate()
+
+    assert err_file.read_bytes().decode("utf-8") == (
+        f"pending\r{SPINNER_FRAMES[0]} Loading...\r{SPINNER_FRAMES[1]} Loading..."
+    )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import markdown
 import pytest
 
@@ -7,6 +9,7 @@ from command_line_assistant.rendering.markdown import (
     ANSIRenderer,
     markdown_to_ansi,
 )
+from command_line_assistant.rendering.theme import Theme
 
 
 class TestANSIRenderer:
@@ -49,6 +52,23 @@ class TestANSIRenderer:
         expected = "\n\033[91m──\033[0m\033[32m python snippet \033[0m\033[91m────────\033[0m\n\033[36mdef hello():\033[0m\n\033[36m    print('world')\033[0m\n\033[91m──────────────────────────\033[0m\n"
         assert result == expected
 
+    def test_code_block_with_no_color(self, monkeypatch):
+        monkeypatch.setenv("NO_COLOR", "1")
+        renderer = ANSIRenderer()
+        result = renderer.code_block("ls\npwd")
+        assert "\nls\npwd\n" in result
+        assert "\033[" not in result
+
+    def test_code_block_label_follows_no_color(self, monkeypatch):
+        renderer = ANSIRenderer()
+        colored = renderer.code_block("ls", "bash")
+        monkeypatch.setenv("NO_COLOR", "1")
+        plain = renderer.code_block("ls", "bash")
+
+        assert "\033[" in colored
+        assert plain.startswith("\n── bash snippet ")
+        assert "\033[" not in plain
+
     @pytest.mark.parametrize("level", [1, 2, 3])
     def test_header(self, level):
         renderer = ANSIRenderer()
@@ -438,10 +458,11 @@ Unicode: 🚀 ✨ 📝
 """
         result = markdown_to_ansi(markdown_input)
 
-        # HTML entities are escaped by markdown parser
-        assert "&amp;" in result  # & becomes &amp;
-        assert "&lt;" in result  # < becomes &lt;
-        assert "&gt;" in result  # > becomes &gt;
+        # The ANSI output is not html, so special characters are kept as-is
+        assert "Text with & ampersand < less than > greater than." in result
+        assert "&amp;" not in result
+        assert "&lt;" not in result
+        assert "&gt;" not in result
         # Escaped characters should be unescaped
         assert "*" in result  # \* becomes *
         assert "_" in result  # \_ becomes _
@@ -549,6 +570,19 @@ console.log("hello");
         # Text in the middle should be present
         assert "Text in the middle" in result
 
+    def test_unknown_code_block_marker_is_kept(self):
+        """Test that markers without a stored code block are left untouched."""
+        md = ANSIMarkdown()
+        md._code_blocks["CODEBLOCK0"] = {"lang": "bash", "code": "ls"}  # type: ignore[attr-defined]
+        postprocessor = md.postprocessors["code_blocks"]
+
+        result = postprocessor.run("<!--CODEBLOCK0--> and <!--CODEBLOCK1-->")
+
+        assert "bash snippet" in result
+        assert "\033[36mls\033[0m" in result
+        assert "<!--CODEBLOCK0-->" not in result
+        assert result.endswith(" and <!--CODEBLOCK1-->")
+
     def test_code_block_preserves_empty_lines(self):
         """Test that code blocks preserve internal empty lines."""
         markdown_input = """```python
@@ -775,6 +809,18 @@ Done."""
         # Headers should be formatted
         assert "\033[32mBold\033[0m" in result or "\033[1mBold\033[0m" in result
 
+    def test_table_cells_are_processed_once(self):
+        """Test that table cells are only rendered by the table formatter."""
+        markdown_input = """| **Bold** | Other |
+|----------|-------|
+| Normal   | Text  |"""
+        with patch.object(
+            ANSIRenderer, "bold", autospec=True, side_effect=lambda _, text: text
+        ) as mock_bold:
+            markdown_to_ansi(markdown_input)
+
+        assert mock_bold.call_count == 1
+
     def test_table_with_alignment(self):
         """Test table with alignment specifiers."""
         markdown_input = """| Left | Center | Right |
@@ -929,3 +975,40 @@ Final paragraph."""
         )  # Table (may not render with borders in all cases)
         assert "\033[90m" in result  # Horizontal rule
         assert "Final paragraph" in result
+
+
+def test_fenced_code_preprocessor_without_fences_returns_lines():
+    md = ANSIMarkdown()
+    preprocessor = md.preprocessors["fenced_code_block"]
+    lines = ["plain text", "with `inline` code"]
+
+    assert preprocessor.run(lines) is lines
+    assert preprocessor.code_blocks == {}
+
+
+def test_markdown_to_ansi_reuses_instance_per_theme():
+    theme = Theme()
+    text = "1. first\n2. second\n\n```python\nprint('hi')\n```"
+
+    with patch(
+        "command_line_assistant.rendering.markdown.ANSIMarkdown",
+        wraps=ANSIMarkdown,
+    ) as mock_markdown:
+        first = markdown_to_ansi(text, theme=theme)
+        second = markdown_to_ansi(text, theme=theme)
+        markdown_to_ansi(text, theme=Theme())
+
+    assert first == second == ANSIMarkdown(theme=theme).convert(text)
+    assert mock_markdown.call_count == 2
+
+
+def test_ansi_markdown_reset_clears_state():
+    md = ANSIMarkdown()
+    md.convert("1. item\n\n```\ncode\n```")
+
+    md.reset()
+
+    assert md._code_blocks == {}
+    assert md.preprocessors["fenced_code_block"].counter == 0
+    assert md.treeprocessors["ansi"].parent_map == {}
+    assert md.treeprocessors["ansi"].list_counters == {}
@@ -8,6 +8,7 @@ from command_line_assistant.rendering import renderers
     (
         # Test bytes (< 1000)
         (0, "0.00 B"),
+        (0.5, "0.50 B"),
         (1, "1.00 B"),
         (42, "42.00 B"),
         (248, "248.00 B"),
@@ -26,6 +27,8 @@ from command_line_assistant.rendering import renderers
         (1000000000000, "1.00 TB"),
         # Test PB boundary and values
         (1000000000000000, "1.00 PB"),
+        # Test values beyond the largest unit are kept in PB
+        (1000000000000000000, "1000.00 PB"),
         # Test float inputs
         (1500.5, "1.50 KB"),
         (2500.75, "2.50 KB"),
@@ -43,3 +46,15 @@ from command_line_assistant.rendering import renderers
 )
 def test_human_readable_size(size, expected):
     assert renderers.human_readable_size(size) == expected
+
+
+@pytest.mark.parametrize(
+    ("unformatted_date", "expected"),
+    (
+        ("2025-01-06 14:30:45.123456", "Monday, January 06, 2025 at 02:30:45 PM"),
+        ("2025-01-06 09:05:01.123", "Monday, January 06, 2025 at 09:05:01 AM"),
+        ("2025-01-06 00:00:00.1", "Monday, January 06, 2025 at 12:00:00 AM"),
+    ),
+)
+def test_format_datetime(unformatted_date, expected):
+    assert renderers.format_datetime(unformatted_date) == expected
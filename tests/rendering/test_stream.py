@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from command_line_assistant.rendering.markdown import markdown_to_ansi
 from command_line_assistant.rendering.stream import StreamWriter
 
 
@@ -78,6 +79,20 @@ class TestStreamWriter:
         mock_stream.write.assert_called_once_with("Test line\n")
         mock_stream.flush.assert_not_called()
 
+    def test_write_line_keeps_order_with_other_streams(self, tmp_path):
+        """Test lines stay in order when stdout and stderr share a file."""
+        output = tmp_path / "output.log"
+        with open(output, "a") as stdout, open(output, "a") as stderr:
+            out_writer = StreamWriter(stream=stdout)
+            err_writer = StreamWriter(stream=stderr)
+
+            out_writer.write_line("line a")
+            out_writer.write_line("line b")
+            err_writer.write_line("error c")
+            out_writer.write_line("line d")
+
+        assert output.read_text() == "line a\nline b\nerror c\nline d\n"
+
     def test_write_line_with_flush_enabled(self):
         """Test write_line method with flush enabled."""
         mock_stream = Mock()
@@ -122,6 +137,64 @@ class TestStreamWriter:
         assert "Simple text" in output
         assert stream._buffer == ""  # Buffer should be cleared after successful render
 
+    @pytest.mark.parametrize(
+        "chunk",
+        (
+            "Simple text",
+            "Hello, world! How are you?",
+            'Quotes "and" (parens) cost $3 or 50%',
+        ),
+    )
+    def test_write_markdown_chunk_plain_text_skips_rendering(self, chunk):
+        """Test write_markdown_chunk writes plain text without parsing it."""
+        custom_stream = io.StringIO()
+        stream = StreamWriter(stream=custom_stream)
+
+        with patch(
+            "command_line_assistant.rendering.stream.markdown_to_ansi"
+        ) as mock_markdown_to_ansi:
+            stream.write_markdown_chunk(chunk)
+
+        mock_markdown_to_ansi.assert_not_called()
+        assert custom_stream.getvalue() == f"{markdown_to_ansi(chunk)}\n"
+
+    @pytest.mark.parametrize(
+        "chunk",
+        (
+            "**Bold** text",
+            "# Header",
+            "1. item",
+            "- item",
+            "  indented",
+            "two\nlines",
+            "a & b",
+        ),
+    )
+    @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
+    def test_write_markdown_chunk_markup_is_rendered(
+        self, mock_markdown_to_ansi, chunk
+    ):
+        """Test write_markdown_chunk renders anything that may contain markup."""
+        mock_markdown_to_ansi.return_value = "rendered"
+        stream = StreamWriter(stream=io.StringIO())
+
+        stream.write_markdown_chunk(chunk)
+
+        mock_markdown_to_ansi.assert_called_once()
+
+    @patch("command_line_assistant.rendering.stream.terminal_width", return_value=10)
+    @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
+    def test_write_markdown_chunk_long_plain_text_is_rendered(
+        self, mock_markdown_to_ansi, _
+    ):
+        """Test write_markdown_chunk leaves wrapping long lines to the renderer."""
+        mock_markdown_to_ansi.return_value = "rendered"
+        stream = StreamWriter(stream=io.StringIO())
+
+        stream.write_markdown_chunk("Simple text")
+
+        mock_markdown_to_ansi.assert_called_once()
+
     @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
     def test_write_markdown_chunk_rendering_exception(self, mock_markdown_to_ansi):
         """Test write_markdown_chunk when markdown rendering raises an exception."""
@@ -130,16 +203,27 @@ class TestStreamWriter:
         custom_stream = io.StringIO()
         stream = StreamWriter(stream=custom_stream)
 
-        stream.write_markdown_chunk("Some markdown")
+        stream.write_markdown_chunk("Some *markdown*")
 
         # Should buffer the content when rendering fails
-        assert stream._buffer == "Some markdown"
+        assert stream._buffer == "Some *markdown*"
         assert custom_stream.getvalue() == ""  # Nothing written to stream
         mock_markdown_to_ansi.assert_called_once()
         args, kwargs = mock_markdown_to_ansi.call_args
-        assert args[0] == "Some markdown"
+        assert args[0] == "Some *markdown*"
         assert "theme" in kwargs
 
+    def test_write_markdown_chunk_stream_error_is_not_buffered(self):
+        """Test write_markdown_chunk doesn't treat write errors as render failures."""
+        mock_stream = Mock()
+        mock_stream.write.side_effect = BrokenPipeError
+        stream = StreamWriter(stream=mock_stream)
+
+        with pytest.raises(BrokenPipeError):
+            stream.write_markdown_chunk("**Bold text**")
+
+        assert stream._buffer == ""
+
     @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
     def test_write_markdown_chunk_buffering_accumulation(self, mock_markdown_to_ansi):
         """Test write_markdown_chunk accumulates content in buffer on repeated failures."""
@@ -148,14 +232,31 @@ class TestStreamWriter:
         custom_stream = io.StringIO()
         stream = StreamWriter(stream=custom_stream)
 
-        stream.write_markdown_chunk("First chunk")
+        stream.write_markdown_chunk("*First* chunk")
         stream.write_markdown_chunk(" Second chunk")
 
         # Should accumulate content in buffer
-        assert stream._buffer == "First chunk Second chunk"
+        assert stream._buffer == "*First* chunk Second chunk"
         assert custom_stream.getvalue() == ""
         assert mock_markdown_to_ansi.call_count == 2
 
+    @patch("command_line_assistant.rendering.stream.MAX_BUFFER_SIZE", 16)
+    @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
+    def test_write_markdown_chunk_buffer_limit(self, mock_markdown_to_ansi):
+        """Test write_markdown_chunk writes raw content once the buffer is too large."""
+        mock_markdown_to_ansi.side_effect = Exception("Rendering failed")
+
+        custom_stream = io.StringIO()
+        stream = StreamWriter(stream=custom_stream)
+
+        stream.write_markdown_chunk("*First* chunk")
+        assert custom_stream.getvalue() == ""
+
+        stream.write_markdown_chunk(" Second chunk")
+
+        assert custom_stream.getvalue() == "*First* chunk Second chunk\n"
+        assert stream._buffer == ""
+
     @patch("command_line_assistant.rendering.stream.markdown_to_ansi")
     def test_write_markdown_chunk_buffer_recovery(self, mock_markdown_to_ansi):
         """Test write_markdown_chunk recovers from buffer when rendering succeeds."""
@@ -169,8 +270,8 @@ class TestStreamWriter:
         stream = StreamWriter(stream=custom_stream)
 
         # First chunk fails and gets buffered
-        stream.write_markdown_chunk("First chunk")
-        assert stream._buffer == "First chunk"
+        stream.write_markdown_chunk("*First* chunk")
+        assert stream._buffer == "*First* chunk"
 
         # Second chunk succeeds with buffered content
         stream.write_markdown_chunk(" Second chunk")
@@ -183,8 +284,8 @@ class TestStreamWriter:
         assert mock_markdown_to_ansi.call_count == 2
         first_call_args = mock_markdown_to_ansi.call_args_list[0]
         second_call_args = mock_markdown_to_ansi.call_args_list[1]
-        assert first_call_args[0][0] == "First chunk"
-        assert second_call_args[0][0] == "First chunk Second chunk"
+        assert first_call_args[0][0] == "*First* chunk"
+        assert second_call_args[0][0] == "*First* chunk Second chunk"
         assert "theme" in first_call_args[1]
         assert "theme" in second_call_args[1]
 
@@ -208,7 +309,7 @@ class TestStreamWriter:
 
         # Should write and flush
         mock_stream.write.assert_called_once()
-        assert mock_stream.flush.call_count == 2
+        mock_stream.flush.assert_called_once()
 
     def test_flush_empty_buffer(self):
         """Test flush method with empty buffer."""
@@ -399,7 +500,7 @@ class TestStreamWriter:
         custom_stream = io.StringIO()
         stream = StreamWriter(stream=custom_stream)
 
-        stream.write_markdown_chunk("chunk1")
+        stream.write_markdown_chunk("*chunk1*")
         stream.write_markdown_chunk("chunk2")
         stream.write_markdown_chunk("chunk3")
 
@@ -407,3 +508,28 @@ class TestStreamWriter:
         assert custom_stream.getvalue() == "Success!\n"
         assert stream._buffer == ""
         assert mock_markdown_to_ansi.call_count == 3
+
+
+def test_batch_writes_once():
+    stream = Mock()
+    writer = StreamWriter(stream=stream)
+
+    with writer.batch():
+        writer.write_line("first")
+        writer.write_line("second")
+        stream.write.assert_not_called()
+
+    stream.write.assert_called_once_with("first\nsecond\n")
+    stream.flush.assert_called_once()
+
+
+def test_batch_without_writes():
+    stream = Mock()
+    writer = StreamWriter(stream=stream)
+
+    with writer.batch():
+        pass
+
+    stream.write.assert_not_called()
+    writer.write_line("after")
+    stream.write.assert_called_once_with("after\n")
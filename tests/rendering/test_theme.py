@@ -0,0 +1,38 @@
+import pytest
+
+from command_line_assistant.rendering.colors import Color
+from command_line_assistant.rendering.theme import Theme
+
+
+def test_default_theme():
+    theme = Theme()
+
+    assert theme.info == Color.BRIGHT_BLUE
+    assert theme.horizontal_rule == Color.BRIGHT_BLACK
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    (
+        ({"colors": {"info": "red"}}, {"info": Color.RED, "error": Color.RED}),
+        (
+            {"markdown": {"header": "BRIGHT_CYAN", "link": Color.WHITE}},
+            {
+                "header": Color.BRIGHT_CYAN,
+                "link": Color.WHITE,
+                "info": Color.BRIGHT_BLUE,
+            },
+        ),
+        ({}, {"warning": Color.YELLOW, "inline_code": Color.CYAN}),
+    ),
+)
+def test_theme_from_config(config, expected):
+    theme = Theme(config)
+
+    for name, color in expected.items():
+        assert getattr(theme, name) == color
+
+
+def test_theme_from_config_unknown_color():
+    with pytest.raises(KeyError):
+        Theme({"colors": {"info": "not-a-color"}})
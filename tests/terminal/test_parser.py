@@ -68,3 +68,16 @@ def test_find_output_by_index(index, expected):
 def test_clean_parsed_text():
     result = parser.clean_parsed_text("\u001b[?2004l\r\r\nexit")
     assert result == "exit"
+
+
+@pytest.mark.parametrize(
+    "text",
+    (
+        "\u001b[?2004l\r\r\nexit",
+        "\u001b[1mls\u001b[0m " + "a" * parser.CLEAN_CACHE_MAX_LENGTH,
+    ),
+)
+def test_clean_parsed_text_short_and_long(text):
+    expected = parser.ANSI_ESCAPE_SEQ.sub("", text).strip()
+    assert parser.clean_parsed_text(text) == expected
+    assert parser.clean_parsed_text(text) == expected
@@ -129,3 +129,54 @@ def test_terminal_recorder_with_empty_data(tmp_path, get_terminal_size_packed):
         data = json.loads(content)
         assert data["command"] == ""
         assert data["output"] == ""
+
+
+def test_terminal_recorder_accumulates_blocks(
+    monkeypatch, tmp_path, get_terminal_size_packed
+):
+    dummy_file = tmp_path / "test.log"
+    chunks = [b"\x1b]prompt$ ls", b"\n", b"file1\n", b"file2\n", b"\x1b]prompt$ "]
+    monkeypatch.setattr(os, "read", mock.Mock(side_effect=chunks))
+    with dummy_file.open(mode="wb") as handler:
+        instance = TerminalRecorder(handler, get_terminal_size_packed)
+        for _ in chunks:
+            instance.read(0)
+
+    block = json.loads(dummy_file.read_text())
+    assert block["command"] == "\x1b]prompt$ ls"
+    assert block["output"] == "file1\nfile2"
+
+
+def test_terminal_recorder_sets_window_size_once(
+    monkeypatch, tmp_path, get_terminal_size_packed
+):
+    dummy_file = tmp_path / "test.log"
+    monkeypatch.setattr(os, "read", mock.Mock(return_value=b"test"))
+    with patch("fcntl.ioctl") as mock_ioctl:
+        with dummy_file.open(mode="wb") as handler:
+            instance = TerminalRecorder(handler, get_terminal_size_packed)
+            instance.read(3)
+            instance.read(3)
+
+    mock_ioctl.assert_called_once_with(
+        3, reader.termios.TIOCSWINSZ, get_terminal_size_packed
+    )
+
+
+def test_terminal_recorder_handle_resize(tmp_path, get_terminal_size_packed):
+    dummy_file = tmp_path / "test.log"
+    with (
+        patch("fcntl.ioctl") as mock_ioctl,
+        patch("shutil.get_terminal_size", return_value=os.terminal_size((120, 40))),
+    ):
+        with dummy_file.open(mode="wb") as handler:
+            instance = TerminalRecorder(handler, get_terminal_size_packed)
+            # Nothing to resize before the pty is known.
+            instance.handle_resize(reader.signal.SIGWINCH, None)
+            mock_ioctl.assert_not_called()
+
+            instance._master_fd = 3
+            instance.handle_resize(reader.signal.SIGWINCH, None)
+
+    expected = struct.pack("HHHH", 40, 120, 0, 0)
+    mock_ioctl.assert_called_once_with(3, reader.termios.TIOCSWINSZ, expected)
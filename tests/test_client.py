@@ -82,10 +82,24 @@ def test_initialize_with_shell_command():
         mock_command.assert_called_once()
 
 
-def test_initialize_with_version(capsys):
+@pytest.mark.parametrize("flag", ("--version", "-v"))
+def test_initialize_with_version(flag, capsys):
     """Test initialize with --version flag"""
     with (
-        patch("sys.argv", ["c", "--version"]),
+        patch("sys.argv", ["c", flag]),
+        patch("command_line_assistant.client.register_subcommands") as mock_register,
+    ):
+        assert main() == 0
+
+        captured = capsys.readouterr()
+        assert captured.out == f"{VERSION}\n"
+        mock_register.assert_not_called()
+
+
+def test_initialize_with_version_and_other_flags(capsys):
+    """Test --version combined with other flags still goes through argparse"""
+    with (
+        patch("sys.argv", ["c", "--debug", "--version"]),
         patch("command_line_assistant.client.read_stdin", lambda: None),
     ):
         with pytest.raises(SystemExit):
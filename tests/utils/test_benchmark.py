@@ -13,6 +13,13 @@ def mock_logger():
         yield mock
 
 
+def _logged_data(mock_logger):
+    """Return the timing record passed to the mocked logger."""
+    message, record = mock_logger.debug.call_args[0]
+    assert message == "%s"
+    return json.loads(str(record))
+
+
 @pytest.fixture
 def timing_logger():
     return TimingLogger()
@@ -70,7 +77,7 @@ class TestLogTiming:
         )
 
         mock_logger.debug.assert_called_once()
-        logged_data = json.loads(mock_logger.debug.call_args[0][0])
+        logged_data = _logged_data(mock_logger)
 
         assert logged_data["function"] == "test_func"
         assert logged_data["args"] == ["arg1", "arg2"]
@@ -94,7 +101,7 @@ class TestLogTiming:
         )
 
         mock_logger.debug.assert_called_once()
-        logged_data = json.loads(mock_logger.debug.call_args[0][0])
+        logged_data = _logged_data(mock_logger)
 
         # Test that args are properly sanitized
         assert logged_data["args"] == [
@@ -126,7 +133,7 @@ class TestTimeitDecorator:
 
         assert result == "done"
         mock_logger.debug.assert_called_once()
-        logged_data = json.loads(mock_logger.debug.call_args[0][0])
+        logged_data = _logged_data(mock_logger)
 
         assert logged_data["function"] == "simple_function"
         assert logged_data["timing"]["duration_ms"] >= 100  # At least 100ms
@@ -141,7 +148,7 @@ class TestTimeitDecorator:
 
         assert result == "done"
         mock_logger.debug.assert_called_once()
-        logged_data = json.loads(mock_logger.debug.call_args[0][0])
+        logged_data = _logged_data(mock_logger)
 
         # Check args are properly logged - note that positional args are labeled as arg_0, arg_1, etc.
         assert logged_data["args"][0] == "visible"  # arg_0 is not filtered
@@ -169,7 +176,7 @@ class TestTimeitDecorator:
 
         # Should still log timing even if function fails
         mock_logger.debug.assert_called_once()
-        logged_data = json.loads(mock_logger.debug.call_args[0][0])
+        logged_data = _logged_data(mock_logger)
         assert logged_data["function"] == "failing_function"
 
     def test_decorator_without_parameters(self, timing_logger, mock_logger):
@@ -191,9 +198,36 @@ class TestTimeitDecorator:
         )
         assert result == "done"
 
-        logged_data = json.dumps(mock_logger.debug.call_args[0][0])
+        logged_data = str(mock_logger.debug.call_args[0][1])
         # Since we're passing these as kwargs, they will be properly filtered
         assert "normal_value" in logged_data  # normal_param should be visible
         assert "sensitive" in logged_data  # key should be visible
         assert "secret_value" not in logged_data  # sensitive value should be redacted
         assert "redacted" in logged_data  # should see the redacted value
+
+
+def test_timing_skipped_when_debug_disabled(timing_logger, mock_logger):
+    mock_logger.isEnabledFor.return_value = False
+
+    @timing_logger.timeit
+    def simple_function():
+        return "done"
+
+    with patch("command_line_assistant.utils.benchmark.time") as mock_time:
+        assert simple_function() == "done"
+
+    mock_time.perf_counter_ns.assert_not_called()
+    mock_logger.debug.assert_not_called()
+
+
+def test_timing_record_is_serialized_lazily(timing_logger, mock_logger):
+    with patch(
+        "command_line_assistant.utils.benchmark.json.dumps", return_value="{}"
+    ) as mock_dumps:
+        timing_logger._log_timing(
+            func_name="test_func", args=(), kwargs={}, duration=1.0, cpu_time=1.0
+        )
+        mock_dumps.assert_not_called()
+
+        str(mock_logger.debug.call_args[0][1])
+        mock_dumps.assert_called_once()
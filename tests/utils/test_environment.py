@@ -20,6 +20,15 @@ def test_get_xdg_config_path(xdg_path_env, expected, monkeypatch: pytest.MonkeyP
     assert environment.get_xdg_config_path() == expected
 
 
+def test_get_xdg_config_path_directory_created_later(tmp_path, monkeypatch):
+    missing, created = tmp_path / "missing", tmp_path / "created"
+    monkeypatch.setenv("XDG_CONFIG_DIRS", f"{missing}:{created}")
+    assert environment.get_xdg_config_path() == Path("/etc/xdg")
+
+    created.mkdir()
+    assert environment.get_xdg_config_path() == created
+
+
 @pytest.mark.parametrize(
     ("xdg_path_env", "expected"),
     (
@@ -48,3 +57,30 @@ def test_get_xdg_data_path(xdg_path_env, expected, monkeypatch):
     monkeypatch.setattr(environment, "WANTED_XDG_DATA_PATH", Path("some/dir"))
     monkeypatch.setenv("XDG_DATA_HOME", xdg_path_env)
     assert environment.get_xdg_data_path() == expected
+
+
+def test_get_xdg_state_path_is_memoized_per_value(monkeypatch):
+    environment._xdg_state_path.cache_clear()
+    monkeypatch.setenv("XDG_STATE_HOME", "/first")
+
+    assert environment.get_xdg_state_path() is environment.get_xdg_state_path()
+    assert environment._xdg_state_path.cache_info().hits == 1
+
+    monkeypatch.setenv("XDG_STATE_HOME", "/second")
+    assert environment.get_xdg_state_path() == Path("/second/command-line-assistant")
+
+
+@pytest.mark.parametrize(
+    ("env", "getter", "expected"),
+    (
+        ("XDG_STATE_HOME", "get_xdg_state_path", ".local/state/command-line-assistant"),
+        ("XDG_DATA_HOME", "get_xdg_data_path", ".local/share/command-line-assistant"),
+    ),
+)
+def test_get_xdg_fallback_expands_home(env, getter, expected, monkeypatch, tmp_path):
+    environment._expand_wanted_path.cache_clear()
+    monkeypatch.delenv(env, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert getattr(environment, getter)() == tmp_path / expected
+    environment._expand_wanted_path.cache_clear()
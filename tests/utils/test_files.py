@@ -8,6 +8,7 @@ from command_line_assistant.utils.files import (
     NamedFileLock,
     create_folder,
     guess_mimetype,
+    normalize_newlines,
     write_file,
 )
 
@@ -27,6 +28,9 @@ def test_guess_mimetype():
         ("file.mp4", "video/mp4"),
         ("file.pdf", "application/pdf"),
         ("file.zip", "application/zip"),
+        ("file.tar.gz", "application/x-tar"),
+        ("file.TXT", "text/plain"),
+        (".hidden.json", "application/json"),
         ("file", "unknown/unknown"),
     ),
 )
@@ -76,6 +80,7 @@ def test_create_folder_already_exists(tmp_path, caplog):
         ("str test", "test-file.log", 0o600, "0600"),
         (b"bytes test", "test-file.log", 0o600, "0600"),
         ("test no mode", "test-file.log", None, "0600"),
+        ("world readable", "test-file.log", 0o644, "0644"),
     ),
 )
 def test_write_file(contents, path, mode, expected_mode, tmp_path):
@@ -86,17 +91,38 @@ def test_write_file(contents, path, mode, expected_mode, tmp_path):
         write_file(contents, test_file)
 
     assert oct(test_file.stat().st_mode).endswith(expected_mode)
+    expected = contents if isinstance(contents, bytes) else contents.encode()
+    assert test_file.read_bytes() == expected
+
+
+def test_write_file_overwrites_existing(tmp_path):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("a much longer previous content")
+    test_file.chmod(0o644)
+
+    write_file("new", test_file)
+
+    assert test_file.read_text() == "new"
+    assert oct(test_file.stat().st_mode).endswith("0600")
+
+
+def test_write_file_large_contents(tmp_path):
+    test_file = tmp_path / "test.bin"
+    contents = os.urandom(4 * 1024 * 1024)
+
+    write_file(contents, test_file)
+
+    assert test_file.read_bytes() == contents
 
 
 def test_write_file_permission_error(tmp_path, monkeypatch):
     """Test write_file behavior with permission errors"""
     test_file = tmp_path / "test.txt"
 
-    # Mock Path.write_text to raise PermissionError
-    def mock_write_text(self, content):
-        raise PermissionError("Permission denied")
-
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    # Mock os.open to raise PermissionError
+    monkeypatch.setattr(
+        os, "open", mock.Mock(side_effect=PermissionError("Permission denied"))
+    )
 
     # Should log error and continue without raising exception
     with pytest.raises(PermissionError):
@@ -155,6 +181,49 @@ class TestNamedFileLock:
         ):
             lock.acquire()
 
+    def test_acquire_lock_file_permissions(self, mock_xdg_path):
+        NamedFileLock(name="test").acquire()
+
+        expected_path = Path(mock_xdg_path, "test.lock")
+        assert oct(expected_path.stat().st_mode).endswith("600")
+
+    def test_acquire_lost_race(self, mock_xdg_path, monkeypatch):
+        lock = NamedFileLock(name="test")
+        # Another process creates the lock right after our is_locked check.
+        monkeypatch.setattr(NamedFileLock, "is_locked", False)
+        Path(mock_xdg_path, "test.lock").write_text("1")
+
+        with pytest.raises(RuntimeError, match="A lock is already active"):
+            lock.acquire()
+
+        # The winner's lock is untouched and no temporary file is left behind.
+        assert Path(mock_xdg_path, "test.lock").read_text() == "1"
+        assert os.listdir(mock_xdg_path) == ["test.lock"]
+
+    def test_acquire_publishes_pid(self, mock_xdg_path):
+        NamedFileLock(name="test").acquire()
+
+        assert Path(mock_xdg_path, "test.lock").read_text() == str(os.getpid())
+        assert os.listdir(mock_xdg_path) == ["test.lock"]
+
+    def test_is_locked_stale_empty_lock(self, mock_xdg_path):
+        expected_path = Path(mock_xdg_path, "test.lock")
+        expected_path.touch()
+
+        lock = NamedFileLock(name="test")
+        assert not lock.is_locked
+        assert not expected_path.exists()
+
+        lock.acquire()
+        assert expected_path.read_text() == str(os.getpid())
+
+    def test_is_locked_invalid_pid(self, mock_xdg_path):
+        expected_path = Path(mock_xdg_path, "test.lock")
+        expected_path.write_text("not-a-pid\n")
+
+        assert not NamedFileLock(name="test").is_locked
+        assert not expected_path.exists()
+
     def test_is_locked_success(self, mock_xdg_path):
         lock = NamedFileLock(name="test")
         lock.acquire()
@@ -184,3 +253,16 @@ class TestNamedFileLock:
 
         expected_path = Path(mock_xdg_path, "test.lock")
         assert not os.path.exists(expected_path)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    (
+        ("a\nb", "a\nb"),
+        ("a\r\nb\r\n", "a\nb\n"),
+        ("a\rb", "a\nb"),
+        ("a\r\r\nb", "a\n\nb"),
+    ),
+)
+def test_normalize_newlines(text, expected):
+    assert normalize_newlines(text) == expected